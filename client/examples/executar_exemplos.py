@@ -6,9 +6,30 @@ Execute este arquivo para testar todos os exemplos disponíveis.
 import sys
 import os
 import asyncio
+import importlib
 
-# Adicionar pasta pai ao path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Garantir que o pacote mt5_client é importável ao rodar direto da árvore.
+# Com o pacote instalado via pip este bloco não altera o sys.path.
+try:
+    import mt5_client  # noqa: F401
+except ImportError:
+    _pacote = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if _pacote not in sys.path:
+        sys.path.insert(0, _pacote)
+
+
+# Cache dos módulos de exemplo: evita repassar pela maquinaria de import
+# (stat de pycache, lookup em sys.modules) a cada escolha do menu
+_MODULOS = {}
+
+
+def _obter_modulo(nome: str):
+    """Importar um módulo de exemplo uma única vez e reutilizá-lo"""
+    modulo = _MODULOS.get(nome)
+    if modulo is None:
+        modulo = importlib.import_module(nome)
+        _MODULOS[nome] = modulo
+    return modulo
 
 
 def mostrar_menu():
@@ -64,14 +85,18 @@ async def testar_configuracao():
         
         try:
             async with client:
-                health = await client.check_health()
+                # Health check e lista de símbolos são independentes —
+                # disparar em paralelo economiza um round-trip
+                health, symbols = await asyncio.gather(
+                    client.check_health(),
+                    client.get_symbols()
+                )
                 print(f"   ✅ API Status: {health.status}")
                 print(f"   📡 MT5 Connected: {health.mt5_connected}")
-                
+
                 if health.mt5_connected:
                     # Testar operação básica
                     print("\n3️⃣ Testando operação básica...")
-                    symbols = await client.get_symbols()
                     print(f"   ✅ {len(symbols)} símbolos obtidos")
                     
                     if symbols:
@@ -102,22 +127,20 @@ async def testar_configuracao():
         return False
 
 
-def executar_exemplo_basico():
-    """Executar exemplo básico"""
+async def executar_exemplo_basico(client):
+    """Executar exemplo básico no event loop compartilhado"""
     try:
-        from exemplo_basico import exemplo_basico
-        asyncio.run(exemplo_basico())
+        await _obter_modulo("exemplo_basico").exemplo_basico(client)
     except ImportError:
         print("❌ Arquivo exemplo_basico.py não encontrado!")
     except Exception as e:
         print(f"❌ Erro ao executar exemplo básico: {e}")
 
 
-def executar_analise_mercado():
-    """Executar análise de mercado"""
+async def executar_analise_mercado(client):
+    """Executar análise de mercado no event loop compartilhado"""
     try:
-        from exemplo_analise_mercado import exemplo_analise_mercado
-        asyncio.run(exemplo_analise_mercado())
+        await _obter_modulo("exemplo_analise_mercado").exemplo_analise_mercado(client)
     except ImportError:
         print("❌ Arquivo exemplo_analise_mercado.py não encontrado!")
     except Exception as e:
@@ -127,8 +150,8 @@ def executar_analise_mercado():
 def executar_uso_simples():
     """Executar uso simples"""
     try:
-        from exemplo_uso_simples import exemplo_uso_simples, exemplo_relatorio_rapido
-        
+        modulo = _obter_modulo("exemplo_uso_simples")
+
         print("\nEscolha o sub-exemplo:")
         print("1. Uso básico síncrono")
         print("2. Relatório rápido")
@@ -136,9 +159,9 @@ def executar_uso_simples():
         sub_opcao = input("Digite a opção (1-2): ").strip()
         
         if sub_opcao == "1":
-            exemplo_uso_simples()
+            modulo.exemplo_uso_simples()
         elif sub_opcao == "2":
-            exemplo_relatorio_rapido()
+            modulo.exemplo_relatorio_rapido()
         else:
             print("❌ Opção inválida!")
             
@@ -150,46 +173,54 @@ def executar_uso_simples():
 
 async def main():
     """Função principal"""
-    
-    while True:
-        try:
-            mostrar_menu()
-            
-            opcao = input("Digite sua opção (0-4): ").strip()
-            
-            if opcao == "0":
-                print("\n👋 Saindo... Até logo!")
+
+    from mt5_client import MT5TradingClient
+
+    # Um único cliente para todos os exemplos: o pool HTTP, as conexões
+    # keep-alive e o cache DNS sobrevivem entre as escolhas do menu
+    async with MT5TradingClient(api_url="http://localhost:8000") as client:
+        while True:
+            try:
+                mostrar_menu()
+
+                opcao = input("Digite sua opção (0-4): ").strip()
+
+                if opcao == "0":
+                    print("\n👋 Saindo... Até logo!")
+                    break
+
+                elif opcao == "1":
+                    print("\n🚀 Executando Exemplo Básico...")
+                    await executar_exemplo_basico(client)
+
+                elif opcao == "2":
+                    print("\n🚀 Executando Análise de Mercado...")
+                    await executar_analise_mercado(client)
+
+                elif opcao == "3":
+                    print("\n🚀 Executando Uso Simples...")
+                    # SimpleMT5Client roda o próprio event loop
+                    # (run_until_complete); chamado direto daqui ele
+                    # colidiria com o loop do menu — vai para uma thread
+                    await asyncio.to_thread(executar_uso_simples)
+
+                elif opcao == "4":
+                    print("\n🚀 Testando Configuração...")
+                    await testar_configuracao()
+
+                else:
+                    print("\n❌ Opção inválida! Tente novamente.")
+
+                # Pausa entre execuções
+                if opcao in ["1", "2", "3", "4"]:
+                    input("\n⏸️ Pressione Enter para continuar...")
+
+            except KeyboardInterrupt:
+                print("\n\n👋 Execução cancelada pelo usuário. Até logo!")
                 break
-                
-            elif opcao == "1":
-                print("\n🚀 Executando Exemplo Básico...")
-                executar_exemplo_basico()
-                
-            elif opcao == "2":
-                print("\n🚀 Executando Análise de Mercado...")
-                executar_analise_mercado()
-                
-            elif opcao == "3":
-                print("\n🚀 Executando Uso Simples...")
-                executar_uso_simples()
-                
-            elif opcao == "4":
-                print("\n🚀 Testando Configuração...")
-                await testar_configuracao()
-                
-            else:
-                print("\n❌ Opção inválida! Tente novamente.")
-            
-            # Pausa entre execuções
-            if opcao in ["1", "2", "3", "4"]:
+            except Exception as e:
+                print(f"\n❌ Erro inesperado: {e}")
                 input("\n⏸️ Pressione Enter para continuar...")
-                
-        except KeyboardInterrupt:
-            print("\n\n👋 Execução cancelada pelo usuário. Até logo!")
-            break
-        except Exception as e:
-            print(f"\n❌ Erro inesperado: {e}")
-            input("\n⏸️ Pressione Enter para continuar...")
 
 
 if __name__ == "__main__":
@@ -8,146 +8,275 @@ Este exemplo demonstra:
 - Identificação de tendências
 """
 import asyncio
+import io
+import logging
 import sys
 import os
+from contextlib import AsyncExitStack
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 
-# Adicionar pasta pai ao path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
+
+# Garantir que o pacote mt5_client é importável ao rodar direto da árvore.
+# Com o pacote instalado via pip este bloco não altera o sys.path.
+try:
+    import mt5_client  # noqa: F401
+except ImportError:
+    _pacote = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if _pacote not in sys.path:
+        sys.path.insert(0, _pacote)
 
 from mt5_client import MT5TradingClient, TickerResponse
 
+log = logging.getLogger("mt5_client.examples")
+
+
+class EstatisticasCorrentes:
+    """
+    Acumulador de estatísticas em passada única
+
+    Mantém contagem, média e variância dos retornos via algoritmo de
+    Welford, além de mínimo/máximo e primeiro/último fechamento — tudo
+    com memória O(1), adequado para consumir cotações em streaming.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.minimo = float("inf")
+        self.maximo = float("-inf")
+        self.primeiro_fechamento = None
+        self.ultimo_fechamento = None
+        # Welford sobre os retornos entre fechamentos consecutivos
+        self._media_retornos = 0.0
+        self._m2_retornos = 0.0
+
+    def atualizar(self, ticker: TickerResponse):
+        """Incorporar uma cotação às estatísticas"""
+        self.n += 1
+        if ticker.low < self.minimo:
+            self.minimo = ticker.low
+        if ticker.high > self.maximo:
+            self.maximo = ticker.high
+
+        if self.primeiro_fechamento is None:
+            self.primeiro_fechamento = ticker.close
+        else:
+            retorno = (ticker.close - self.ultimo_fechamento) / self.ultimo_fechamento
+            k = self.n - 1  # número de retornos acumulados
+            delta = retorno - self._media_retornos
+            self._media_retornos += delta / k
+            self._m2_retornos += delta * (retorno - self._media_retornos)
+
+        self.ultimo_fechamento = ticker.close
+
+    @property
+    def volatilidade(self) -> float:
+        """Desvio padrão dos retornos, em percentual"""
+        retornos = self.n - 1
+        if retornos < 1:
+            return 0.0
+        return (self._m2_retornos / retornos) ** 0.5 * 100
+
+    @property
+    def variacao_periodo(self) -> float:
+        """Variação percentual entre o primeiro e o último fechamento"""
+        if not self.primeiro_fechamento:
+            return 0.0
+        return ((self.ultimo_fechamento - self.primeiro_fechamento) / self.primeiro_fechamento) * 100
+
+
+async def analisar_simbolo_streaming(client: MT5TradingClient, symbol: str, dias: int = 30):
+    """
+    Análise resumida consumindo cotações em streaming
+
+    Útil para períodos longos: as estatísticas são atualizadas cotação a
+    cotação, sem materializar listas/arrays do período inteiro.
+    """
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=dias)
+
+    stats = EstatisticasCorrentes()
+    async for ticker in client.iter_tickers(symbol, start_date, end_date, timeframe=16385):
+        stats.atualizar(ticker)
+
+    if stats.n == 0:
+        print(f"❌ Nenhuma cotação encontrada para {symbol}")
+        return
+
+    print(f"\n📊 {symbol} ({dias} dias, {stats.n} cotações):")
+    print(f"   💰 Último fechamento: {stats.ultimo_fechamento:.5f}")
+    print(f"   📈 Máximo: {stats.maximo:.5f} | 📉 Mínimo: {stats.minimo:.5f}")
+    print(f"   📊 Variação: {stats.variacao_periodo:+.2f}% | Volatilidade: {stats.volatilidade:.2f}%")
+
+
+def tickers_para_arrays(tickers: List[TickerResponse]) -> dict:
+    """
+    Converter a lista de tickers em arrays NumPy (layout Struct-of-Arrays)
+
+    Uma única passada pelos tickers preenche os quatro arrays; todas as
+    estatísticas seguintes viram operações vetorizadas sobre eles.
+    """
+    n = len(tickers)
+    arrays = {
+        "open": np.empty(n, dtype=np.float64),
+        "high": np.empty(n, dtype=np.float64),
+        "low": np.empty(n, dtype=np.float64),
+        "close": np.empty(n, dtype=np.float64),
+    }
+
+    for i, ticker in enumerate(tickers):
+        arrays["open"][i] = ticker.open
+        arrays["high"][i] = ticker.high
+        arrays["low"][i] = ticker.low
+        arrays["close"][i] = ticker.close
+
+    return arrays
 
-def calcular_media_movel(precos: List[float], periodo: int) -> float:
-    """Calcular média móvel simples"""
+
+def calcular_media_movel(precos: np.ndarray, periodo: int) -> float:
+    """Calcular média móvel simples (vetorizado)"""
     if len(precos) < periodo:
         return None
-    return sum(precos[-periodo:]) / periodo
+    return float(precos[-periodo:].mean())
 
 
-def calcular_volatilidade(precos: List[float]) -> float:
-    """Calcular volatilidade (desvio padrão dos retornos)"""
+def calcular_volatilidade(precos: np.ndarray) -> float:
+    """Calcular volatilidade (desvio padrão dos retornos, vetorizado)"""
     if len(precos) < 2:
-        return 0
-    
-    # Calcular retornos
-    retornos = []
-    for i in range(1, len(precos)):
-        retorno = (precos[i] - precos[i-1]) / precos[i-1]
-        retornos.append(retorno)
-    
-    # Calcular média dos retornos
-    media = sum(retornos) / len(retornos)
-    
-    # Calcular variância
-    variancia = sum((r - media) ** 2 for r in retornos) / len(retornos)
-    
-    # Retornar desvio padrão (volatilidade)
-    return (variancia ** 0.5) * 100  # Em percentual
+        return 0.0
+
+    # Retornos percentuais em uma única operação C-level
+    retornos = np.diff(precos) / precos[:-1]
 
+    # Desvio padrão populacional dos retornos, em percentual
+    return float(retornos.std()) * 100
 
-def identificar_tendencia(precos: List[float], ma_curta: int = 10, ma_longa: int = 20) -> str:
-    """Identificar tendência baseada em médias móveis"""
+
+def media_movel_serie(precos: np.ndarray, periodo: int) -> np.ndarray:
+    """Calcular a série completa de média móvel em uma única passada"""
+    return np.convolve(precos, np.ones(periodo) / periodo, mode='valid')
+
+
+def identificar_tendencia(precos: np.ndarray, ma_curta: int = 10, ma_longa: int = 20) -> str:
+    """Identificar tendência comparando as séries de médias móveis"""
     if len(precos) < ma_longa:
         return "Dados insuficientes"
-    
-    ma_10 = calcular_media_movel(precos, ma_curta)
-    ma_20 = calcular_media_movel(precos, ma_longa)
-    
-    if ma_10 is None or ma_20 is None:
-        return "Dados insuficientes"
-    
-    if ma_10 > ma_20:
+
+    # Séries completas via convolução (uma passada SIMD por janela),
+    # sem re-somar cada janela do zero
+    serie_curta = media_movel_serie(precos, ma_curta)
+    serie_longa = media_movel_serie(precos, ma_longa)
+
+    diferenca = serie_curta[-1] - serie_longa[-1]
+
+    if diferenca > 0:
         return "Alta (Bullish)"
-    elif ma_10 < ma_20:
+    elif diferenca < 0:
         return "Baixa (Bearish)"
     else:
         return "Lateral"
 
 
-async def analisar_simbolo(client: MT5TradingClient, symbol: str, dias: int = 7):
-    """Análise completa de um símbolo"""
-    
-    print(f"\n📊 Analisando {symbol}:")
-    print("-" * 40)
-    
+async def analisar_simbolo(
+    client: MT5TradingClient,
+    symbol: str,
+    dias: int = 7,
+    semaforo: Optional[asyncio.Semaphore] = None,
+    tickers_h1: Optional[List[TickerResponse]] = None
+):
+    """
+    Análise completa de um símbolo
+
+    O relatório é montado em um buffer local e impresso de uma só vez,
+    para que análises concorrentes não intercalem suas saídas.
+    """
+
+    # Limitar requisições simultâneas quando executado em paralelo
+    if semaforo is None:
+        semaforo = asyncio.Semaphore(8)
+
+    saida = io.StringIO()
+    print(f"\n📊 Analisando {symbol}:", file=saida)
+    print("-" * 40, file=saida)
+
     # Definir período de análise
     end_date = datetime.now()
     start_date = end_date - timedelta(days=dias)
-    
+
     try:
-        # 1. Obter cotações H1 da última semana
-        print("1. Obtendo cotações H1...")
-        tickers_h1 = await client.get_tickers(
-            symbol=symbol,
-            date_from=start_date,
-            date_to=end_date,
-            timeframe=16385  # H1
-        )
-        
+        # 1. Obter cotações H1 da última semana (se não vieram pré-carregadas)
+        print("1. Obtendo cotações H1...", file=saida)
+        if tickers_h1 is None:
+            async with semaforo:
+                tickers_h1 = await client.get_tickers(
+                    symbol=symbol,
+                    date_from=start_date,
+                    date_to=end_date,
+                    timeframe=16385  # H1
+                )
+
         if not tickers_h1:
-            print(f"❌ Nenhuma cotação encontrada para {symbol}")
+            print(f"❌ Nenhuma cotação encontrada para {symbol}", file=saida)
             return
+
+        print(f"   📈 {len(tickers_h1)} cotações obtidas", file=saida)
         
-        print(f"   📈 {len(tickers_h1)} cotações obtidas")
-        
-        # 2. Extrair preços de fechamento
-        precos_fechamento = [ticker.close for ticker in tickers_h1]
-        precos_maximos = [ticker.high for ticker in tickers_h1]
-        precos_minimos = [ticker.low for ticker in tickers_h1]
-        
+        # 2. Extrair preços como arrays NumPy (SoA, uma única passada)
+        arrays = tickers_para_arrays(tickers_h1)
+        precos_fechamento = arrays["close"]
+
         # 3. Calcular estatísticas básicas
-        print("\n2. Estatísticas básicas:")
-        preco_atual = precos_fechamento[-1]
-        preco_max = max(precos_maximos)
-        preco_min = min(precos_minimos)
+        print("\n2. Estatísticas básicas:", file=saida)
+        preco_atual = float(precos_fechamento[-1])
+        preco_max = float(arrays["high"].max())
+        preco_min = float(arrays["low"].min())
         variacao_periodo = ((preco_atual - precos_fechamento[0]) / precos_fechamento[0]) * 100
-        
-        print(f"   💰 Preço atual: {preco_atual:.5f}")
-        print(f"   📈 Máximo do período: {preco_max:.5f}")
-        print(f"   📉 Mínimo do período: {preco_min:.5f}")
-        print(f"   📊 Variação do período: {variacao_periodo:+.2f}%")
-        
+
+        print(f"   💰 Preço atual: {preco_atual:.5f}", file=saida)
+        print(f"   📈 Máximo do período: {preco_max:.5f}", file=saida)
+        print(f"   📉 Mínimo do período: {preco_min:.5f}", file=saida)
+        print(f"   📊 Variação do período: {variacao_periodo:+.2f}%", file=saida)
+
         # 4. Médias móveis
-        print("\n3. Médias móveis:")
+        print("\n3. Médias móveis:", file=saida)
         ma_5 = calcular_media_movel(precos_fechamento, 5)
         ma_10 = calcular_media_movel(precos_fechamento, 10)
         ma_20 = calcular_media_movel(precos_fechamento, 20)
-        
-        if ma_5: print(f"   MA5: {ma_5:.5f}")
-        if ma_10: print(f"   MA10: {ma_10:.5f}")
-        if ma_20: print(f"   MA20: {ma_20:.5f}")
-        
+
+        if ma_5: print(f"   MA5: {ma_5:.5f}", file=saida)
+        if ma_10: print(f"   MA10: {ma_10:.5f}", file=saida)
+        if ma_20: print(f"   MA20: {ma_20:.5f}", file=saida)
+
         # 5. Volatilidade
-        print("\n4. Análise de volatilidade:")
+        print("\n4. Análise de volatilidade:", file=saida)
         volatilidade = calcular_volatilidade(precos_fechamento)
-        print(f"   📊 Volatilidade: {volatilidade:.2f}%")
-        
+        print(f"   📊 Volatilidade: {volatilidade:.2f}%", file=saida)
+
         if volatilidade > 2.0:
             vol_status = "🔴 Alta volatilidade"
         elif volatilidade > 1.0:
             vol_status = "🟡 Volatilidade moderada"
         else:
             vol_status = "🟢 Baixa volatilidade"
-        
-        print(f"   {vol_status}")
-        
+
+        print(f"   {vol_status}", file=saida)
+
         # 6. Tendência
-        print("\n5. Análise de tendência:")
+        print("\n5. Análise de tendência:", file=saida)
         tendencia = identificar_tendencia(precos_fechamento)
-        print(f"   📈 Tendência: {tendencia}")
-        
+        print(f"   📈 Tendência: {tendencia}", file=saida)
+
         # 7. Últimas 5 cotações
-        print("\n6. Últimas 5 cotações H1:")
+        print("\n6. Últimas 5 cotações H1:", file=saida)
         for i, ticker in enumerate(tickers_h1[-5:], 1):
             print(f"   {i}. {ticker.time.strftime('%d/%m %H:%M')} | "
                   f"O: {ticker.open:.5f} | H: {ticker.high:.5f} | "
-                  f"L: {ticker.low:.5f} | C: {ticker.close:.5f}")
-        
+                  f"L: {ticker.low:.5f} | C: {ticker.close:.5f}", file=saida)
+
         # 8. Sugestão baseada na análise
-        print("\n7. 💡 Análise resumida:")
-        
+        print("\n7. 💡 Análise resumida:", file=saida)
+
         if tendencia == "Alta (Bullish)" and volatilidade < 1.5:
             sugestao = "🟢 Cenário favorável para alta"
         elif tendencia == "Baixa (Bearish)" and volatilidade < 1.5:
@@ -156,23 +285,32 @@ async def analisar_simbolo(client: MT5TradingClient, symbol: str, dias: int = 7)
             sugestao = "⚠️ Alta volatilidade - aguardar estabilização"
         else:
             sugestao = "🟡 Mercado lateral - aguardar definição"
-        
-        print(f"   {sugestao}")
-    
+
+        print(f"   {sugestao}", file=saida)
+
     except Exception as e:
-        print(f"❌ Erro ao analisar {symbol}: {e}")
+        print(f"❌ Erro ao analisar {symbol}: {e}", file=saida)
 
+    finally:
+        # Imprimir o relatório completo de uma vez (saída atômica)
+        print(saida.getvalue(), end="")
+
+
+async def exemplo_analise_mercado(client: Optional[MT5TradingClient] = None):
+    """
+    Exemplo principal de análise de mercado
+
+    Aceita um cliente compartilhado (pool HTTP/keep-alive reutilizados);
+    sem ele, cria e fecha um cliente próprio.
+    """
 
-async def exemplo_analise_mercado():
-    """Exemplo principal de análise de mercado"""
-    
-    client = MT5TradingClient(
-        api_url="http://localhost:8000",
-        timeout=30
-    )
-    
     try:
-        async with client:
+        async with AsyncExitStack() as stack:
+            if client is None:
+                client = await stack.enter_async_context(MT5TradingClient(
+                    api_url="http://localhost:8000",
+                    timeout=30
+                ))
             print("🚀 Iniciando análise de mercado...")
             
             # Verificar conexão
@@ -185,38 +323,62 @@ async def exemplo_analise_mercado():
             simbolos_analise = ["EURUSD", "GBPUSD", "USDJPY", "AUDUSD"]
             
             print(f"\n📊 Analisando {len(simbolos_analise)} símbolos:")
+
+            # Buscar cotações de todos os símbolos em uma única requisição
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=7)
+            tickers_por_simbolo = await client.get_tickers_batch(
+                symbols=simbolos_analise,
+                date_from=start_date,
+                date_to=end_date,
+                timeframe=16385  # H1
+            )
+
+            # Analisar todos os símbolos em paralelo (requisições concorrentes),
+            # limitando as requisições simultâneas para não saturar a API
+            semaforo = asyncio.Semaphore(8)
+            await asyncio.gather(*(
+                analisar_simbolo(
+                    client, symbol, dias=7, semaforo=semaforo,
+                    tickers_h1=tickers_por_simbolo.get(symbol)
+                )
+                for symbol in simbolos_analise
+            ))
             
-            # Analisar cada símbolo
-            for symbol in simbolos_analise:
-                await analisar_simbolo(client, symbol, dias=7)
-            
-            # Comparação final
-            print("\n" + "=" * 60)
-            print("📈 RESUMO COMPARATIVO")
-            print("=" * 60)
-            
-            # Obter variações atuais
-            changes = await client.get_daily_changes(simbolos_analise)
-            prices = await client.get_current_prices(simbolos_analise)
-            
-            print("\nDesempenho diário:")
+            # Obter variações e preços atuais em paralelo (chamadas independentes)
+            changes, prices = await asyncio.gather(
+                client.get_daily_changes(simbolos_analise),
+                client.get_current_prices(simbolos_analise)
+            )
+
+            # Comparação final — montar o bloco inteiro e escrever de uma vez
+            resumo = [
+                "",
+                "=" * 60,
+                "📈 RESUMO COMPARATIVO",
+                "=" * 60,
+                "",
+                "Desempenho diário:",
+            ]
+
             simbolos_ordenados = sorted(
-                changes.items(), 
-                key=lambda x: x[1], 
+                changes.items(),
+                key=lambda x: x[1],
                 reverse=True
             )
-            
+
             for i, (symbol, change) in enumerate(simbolos_ordenados, 1):
                 price = prices.get(symbol, "N/A")
                 status = "🟢" if change > 0 else "🔴" if change < 0 else "⚪"
-                print(f"{i}. {status} {symbol}: {price} ({change:+.2f}%)")
-            
-            print("\n✅ Análise de mercado concluída!")
+                resumo.append(f"{i}. {status} {symbol}: {price} ({change:+.2f}%)")
+
+            resumo.append("\n✅ Análise de mercado concluída!")
+            sys.stdout.write("\n".join(resumo) + "\n")
+            sys.stdout.flush()
     
     except Exception as e:
         print(f"❌ Erro durante análise: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Falha na análise de mercado")
 
 
 if __name__ == "__main__":
@@ -8,27 +8,43 @@ Este exemplo demonstra o uso básico do cliente para:
 - Obter preços atuais
 """
 import asyncio
+import logging
 import sys
 import os
+from contextlib import AsyncExitStack
+from typing import Optional
 
-# Adicionar pasta pai ao path para importar mt5_client
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Garantir que o pacote mt5_client é importável ao rodar direto da árvore.
+# Com o pacote instalado via pip este bloco não altera o sys.path.
+try:
+    import mt5_client  # noqa: F401
+except ImportError:
+    _pacote = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if _pacote not in sys.path:
+        sys.path.insert(0, _pacote)
 
 from mt5_client import MT5TradingClient
 
+log = logging.getLogger("mt5_client.examples")
+
+
+async def exemplo_basico(client: Optional[MT5TradingClient] = None):
+    """
+    Exemplo básico de uso do cliente MT5
+
+    Aceita um cliente compartilhado (pool HTTP/keep-alive reutilizados);
+    sem ele, cria e fecha um cliente próprio.
+    """
 
-async def exemplo_basico():
-    """Exemplo básico de uso do cliente MT5"""
-    
-    # Criar cliente (substitua pela URL do seu servidor)
-    client = MT5TradingClient(
-        api_url="http://localhost:8000",
-        timeout=30,
-        log_level="INFO"
-    )
-    
     try:
-        async with client:
+        async with AsyncExitStack() as stack:
+            if client is None:
+                # Criar cliente próprio (substitua pela URL do seu servidor)
+                client = await stack.enter_async_context(MT5TradingClient(
+                    api_url="http://localhost:8000",
+                    timeout=30,
+                    log_level="INFO"
+                ))
             print("🚀 Conectando à API MT5...")
             
             # 1. Verificar saúde da API
@@ -62,12 +78,12 @@ async def exemplo_basico():
             for pair in major_pairs:
                 print(f"   {pair.name} - {pair.description}")
             
-            # 5. Dados de mercado de símbolos específicos
+            # 5. Dados de mercado de símbolos específicos (uma chamada em lote)
             print("\n5️⃣ Dados de mercado detalhados:")
             test_symbols = ["EURUSD", "GBPUSD", "USDJPY"]
-            
-            for symbol_name in test_symbols:
-                market_data = await client.get_market_data(symbol_name)
+
+            market_data_many = await client.get_market_data_many(test_symbols)
+            for symbol_name, market_data in market_data_many.items():
                 if market_data:
                     print(f"   {symbol_name}:")
                     print(f"     Preço atual: {market_data.current_price}")
@@ -96,8 +112,7 @@ async def exemplo_basico():
     
     except Exception as e:
         print(f"❌ Erro durante execução: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Falha no exemplo básico")
 
 
 if __name__ == "__main__":
@@ -6,15 +6,26 @@ Este exemplo demonstra o uso da interface síncrona para:
 - Monitoramento básico
 - Relatórios rápidos
 """
+import asyncio
+import logging
+import statistics
 import sys
 import os
 import time
 from datetime import datetime
 
-# Adicionar pasta pai ao path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Garantir que o pacote mt5_client é importável ao rodar direto da árvore.
+# Com o pacote instalado via pip este bloco não altera o sys.path.
+try:
+    import mt5_client  # noqa: F401
+except ImportError:
+    _pacote = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if _pacote not in sys.path:
+        sys.path.insert(0, _pacote)
 
-from mt5_client import SimpleMT5Client
+from mt5_client import MT5TradingClient, SimpleMT5Client
+
+log = logging.getLogger("mt5_client.examples")
 
 
 def exemplo_uso_simples():
@@ -35,27 +46,20 @@ def exemplo_uso_simples():
                 print("❌ MT5 não está conectado!")
                 return
             
-            # 2. Obter símbolos
+            # 2. Obter símbolos (índice cacheado {nome: símbolo})
             print("\n2️⃣ Obtendo símbolos:")
-            symbols = client.get_symbols()
-            print(f"   Total: {len(symbols)} símbolos")
-            
+            indice_simbolos = client.get_symbol_index()
+            print(f"   Total: {len(indice_simbolos)} símbolos")
+
             # 3. Listar principais pares
             principais_pares = ["EURUSD", "GBPUSD", "USDJPY", "AUDUSD", "USDCHF", "NZDUSD"]
-            
+
             print(f"\n3️⃣ Verificando disponibilidade dos principais pares:")
-            pares_disponiveis = []
-            
+            pares_disponiveis = [pair for pair in principais_pares if pair in indice_simbolos]
+
             for pair in principais_pares:
-                symbol_info = None
-                # Procurar o par na lista de símbolos
-                for symbol in symbols:
-                    if symbol.name == pair:
-                        symbol_info = symbol
-                        break
-                
+                symbol_info = indice_simbolos.get(pair)
                 if symbol_info:
-                    pares_disponiveis.append(pair)
                     print(f"   ✅ {pair} - {symbol_info.description}")
                 else:
                     print(f"   ❌ {pair} - Não disponível")
@@ -95,50 +99,65 @@ def exemplo_uso_simples():
             print(f"❌ Erro durante execução: {e}")
 
 
-def exemplo_monitoramento_continuo():
-    """Exemplo de monitoramento contínuo simples"""
-    
+async def exemplo_monitoramento_async():
+    """
+    Monitoramento contínuo usando o event loop assíncrono
+
+    Dormir com await asyncio.sleep libera o loop entre as consultas,
+    ao contrário de time.sleep, que bloqueia a thread inteira.
+    """
+
     print("\n🔄 Iniciando monitoramento contínuo...")
     print("   (Pressione Ctrl+C para parar)")
-    
+
     simbolos_monitorar = ["EURUSD", "GBPUSD"]
-    
+
+    async with MT5TradingClient(api_url="http://localhost:8000") as client:
+
+        # Verificar conexão inicial
+        health = await client.check_health()
+        if not health.mt5_connected:
+            print("❌ MT5 não está conectado!")
+            return
+
+        contador = 0
+        # Rate-limit do log de erro: no máximo 1 stack trace a cada 5 s,
+        # para falhas em rajada não inundarem a saída do monitoramento
+        ultimo_log_erro = 0.0
+
+        while True:
+            contador += 1
+            timestamp = datetime.now().strftime("%H:%M:%S")
+
+            print(f"\n📊 [{timestamp}] Atualização #{contador}:")
+
+            try:
+                # Obter preços atuais (fan-out interno já é concorrente)
+                prices = await client.get_current_prices(simbolos_monitorar)
+
+                for symbol, price in prices.items():
+                    print(f"   {symbol}: {price}")
+
+                # Aguardar sem bloquear o event loop
+                print("   ⏳ Aguardando 10 segundos...")
+                await asyncio.sleep(10)
+
+            except Exception as e:
+                print(f"   ❌ Erro: {e}")
+                agora = time.monotonic()
+                if agora - ultimo_log_erro >= 5.0:
+                    ultimo_log_erro = agora
+                    log.exception("Falha na atualização do monitoramento")
+                print("   ⏳ Aguardando 30 segundos antes de tentar novamente...")
+                await asyncio.sleep(30)
+
+
+def exemplo_monitoramento_continuo():
+    """Wrapper síncrono do monitoramento contínuo"""
     try:
-        with SimpleMT5Client(api_url="http://localhost:8000") as client:
-            
-            # Verificar conexão inicial
-            health = client.check_health()
-            if not health.mt5_connected:
-                print("❌ MT5 não está conectado!")
-                return
-            
-            contador = 0
-            
-            while True:
-                contador += 1
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                
-                print(f"\n📊 [{timestamp}] Atualização #{contador}:")
-                
-                try:
-                    # Obter preços atuais
-                    prices = client.get_current_prices(simbolos_monitorar)
-                    
-                    for symbol, price in prices.items():
-                        print(f"   {symbol}: {price}")
-                    
-                    # Aguardar 10 segundos
-                    print("   ⏳ Aguardando 10 segundos...")
-                    time.sleep(10)
-                
-                except KeyboardInterrupt:
-                    print("\n⏹️ Monitoramento interrompido pelo usuário")
-                    break
-                except Exception as e:
-                    print(f"   ❌ Erro: {e}")
-                    print("   ⏳ Aguardando 30 segundos antes de tentar novamente...")
-                    time.sleep(30)
-    
+        asyncio.run(exemplo_monitoramento_async())
+    except KeyboardInterrupt:
+        print("\n⏹️ Monitoramento interrompido pelo usuário")
     except Exception as e:
         print(f"❌ Erro no monitoramento: {e}")
 
@@ -151,56 +170,60 @@ def exemplo_relatorio_rapido():
     with SimpleMT5Client(api_url="http://localhost:8000") as client:
         
         try:
-            # Obter dados
+            # Obter dados (índice cacheado com TTL — não re-baixa a lista)
             health = client.check_health()
-            symbols = client.get_symbols()
-            
+            indice_simbolos = client.get_symbol_index()
+
             # Definir símbolos para relatório
             principais_pares = ["EURUSD", "GBPUSD", "USDJPY", "AUDUSD"]
-            
-            # Filtrar pares disponíveis
-            pares_disponiveis = []
-            for pair in principais_pares:
-                if any(s.name == pair for s in symbols):
-                    pares_disponiveis.append(pair)
+
+            # Filtrar pares disponíveis com lookups O(1)
+            pares_disponiveis = [pair for pair in principais_pares if pair in indice_simbolos]
             
             if pares_disponiveis:
-                prices = client.get_current_prices(pares_disponiveis)
-                changes = client.get_daily_changes(pares_disponiveis)
-            
-            # Gerar relatório
-            print("\n" + "=" * 50)
-            print("📊 RELATÓRIO DE MERCADO MT5")
-            print("=" * 50)
-            print(f"📅 Data/Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
-            print(f"🔗 Status API: {health.status}")
-            print(f"📈 Total símbolos: {len(symbols)}")
-            print(f"💱 Pares analisados: {len(pares_disponiveis)}")
+                # Preços e variações em paralelo (uma entrada no event loop)
+                prices, changes = client.get_prices_and_changes(pares_disponiveis)
             
+            # Gerar relatório em buffer e escrever de uma só vez
+            linhas = [
+                "",
+                "=" * 50,
+                "📊 RELATÓRIO DE MERCADO MT5",
+                "=" * 50,
+                f"📅 Data/Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}",
+                f"🔗 Status API: {health.status}",
+                f"📈 Total símbolos: {len(indice_simbolos)}",
+                f"💱 Pares analisados: {len(pares_disponiveis)}",
+            ]
+
             if pares_disponiveis:
-                print(f"\n💰 PREÇOS ATUAIS:")
-                print("-" * 30)
+                linhas.append("\n💰 PREÇOS ATUAIS:")
+                linhas.append("-" * 30)
                 for symbol in pares_disponiveis:
                     price = prices.get(symbol, "N/A")
                     change = changes.get(symbol, 0)
                     trend = "↗️" if change > 0.1 else "↘️" if change < -0.1 else "→"
-                    print(f"{symbol:<8} {price:<10} {trend} {change:+6.2f}%")
-                
+                    linhas.append(f"{symbol:<8} {price:<10} {trend} {change:+6.2f}%")
+
                 # Estatísticas resumidas
                 valid_changes = [c for c in changes.values() if c != 0]
                 if valid_changes:
-                    avg_change = sum(valid_changes) / len(valid_changes)
+                    # fmean é implementado em C e numericamente mais estável
+                    # que sum()/len() para listas de floats
+                    avg_change = statistics.fmean(valid_changes)
                     max_change = max(valid_changes)
                     min_change = min(valid_changes)
-                    
-                    print(f"\n📊 RESUMO ESTATÍSTICO:")
-                    print("-" * 30)
-                    print(f"Variação média: {avg_change:+.2f}%")
-                    print(f"Maior alta:     {max_change:+.2f}%")
-                    print(f"Maior baixa:    {min_change:+.2f}%")
-            
-            print("=" * 50)
-            print("✅ Relatório gerado com sucesso!")
+
+                    linhas.append("\n📊 RESUMO ESTATÍSTICO:")
+                    linhas.append("-" * 30)
+                    linhas.append(f"Variação média: {avg_change:+.2f}%")
+                    linhas.append(f"Maior alta:     {max_change:+.2f}%")
+                    linhas.append(f"Maior baixa:    {min_change:+.2f}%")
+
+            linhas.append("=" * 50)
+            linhas.append("✅ Relatório gerado com sucesso!")
+            sys.stdout.write("\n".join(linhas) + "\n")
+            sys.stdout.flush()
         
         except Exception as e:
             print(f"❌ Erro ao gerar relatório: {e}")
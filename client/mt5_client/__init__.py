@@ -48,9 +48,10 @@ Funcionalidades principais:
 # Importações principais
 from .presentation import (
     MT5TradingClient,
-    SimpleMT5Client, 
+    SimpleMT5Client,
     create_client,
-    create_simple_client
+    create_simple_client,
+    configure_logging
 )
 
 # DTOs para uso externo
@@ -83,8 +84,11 @@ __all__ = [
     "SimpleMT5Client",
     
     # Factory functions
-    "create_client", 
+    "create_client",
     "create_simple_client",
+
+    # Logging
+    "configure_logging",
     
     # DTOs
     "SymbolResponse",
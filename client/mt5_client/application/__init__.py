@@ -8,13 +8,15 @@ from .dtos import (
     GetSymbolsRequest,
     GetSymbolInfoRequest, 
     GetTickersRequest,
+    GetTickersBatchRequest,
     GetTickersPosRequest,
     GetSymbolsPctChangeRequest,
     GetMarketDataRequest,
     SearchSymbolsRequest,
     SymbolResponse,
     TickerResponse,
-    SymbolPctChangeResponse, 
+    TickerArrayResponse,
+    SymbolPctChangeResponse,
     MarketDataResponse,
     ApiHealthResponse,
     GenericResponse
@@ -27,8 +29,13 @@ from .use_cases import (
     GetSymbolInfoUseCase,
     SearchSymbolsUseCase,
     GetTickersUseCase,
+    IterTickersUseCase,
+    GetTickersArrayUseCase,
+    GetTickersBatchUseCase,
     GetTickersPosUseCase,
     GetSymbolsPctChangeUseCase,
+    GetCurrentPricesUseCase,
+    StreamPricesUseCase,
     GetMarketDataUseCase,
     GetMultipleMarketDataUseCase,
     CheckApiHealthUseCase,
@@ -40,12 +47,14 @@ __all__ = [
     "GetSymbolsRequest",
     "GetSymbolInfoRequest",
     "GetTickersRequest", 
+    "GetTickersBatchRequest",
     "GetTickersPosRequest",
     "GetSymbolsPctChangeRequest",
     "GetMarketDataRequest",
     "SearchSymbolsRequest",
     "SymbolResponse",
     "TickerResponse",
+    "TickerArrayResponse",
     "SymbolPctChangeResponse",
     "MarketDataResponse", 
     "ApiHealthResponse",
@@ -57,8 +66,13 @@ __all__ = [
     "GetSymbolInfoUseCase", 
     "SearchSymbolsUseCase",
     "GetTickersUseCase",
+    "IterTickersUseCase",
+    "GetTickersArrayUseCase",
+    "GetTickersBatchUseCase",
     "GetTickersPosUseCase",
     "GetSymbolsPctChangeUseCase",
+    "GetCurrentPricesUseCase",
+    "StreamPricesUseCase",
     "GetMarketDataUseCase",
     "GetMultipleMarketDataUseCase",
     "CheckApiHealthUseCase",
@@ -0,0 +1,61 @@
+"""
+MT5 Client - Kernels numéricos da camada de aplicação
+
+Reduções compiladas com Numba para as análises de mercado. O Numba é
+opcional (extra "accel"): sem ele, as mesmas reduções caem para NumPy
+vetorizado, com a mesma assinatura e os mesmos resultados.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+def _analyze_pct_numpy(arr: np.ndarray) -> tuple:
+    """Fallback vetorizado em NumPy puro"""
+    if arr.size == 0:
+        return 0, 0, 0.0
+    pos = int(np.count_nonzero(arr > 0))
+    neg = int(np.count_nonzero(arr < 0))
+    return pos, neg, float(arr.mean())
+
+
+if _HAS_NUMBA:
+    # Assinatura explícita: a compilação acontece no import (uma vez por
+    # máquina — cache=True grava o código nativo em disco), não na
+    # primeira análise. Sem ela, o warmup do JIT (1–3s) cairia no meio da
+    # primeira requisição do usuário; com ela, o custo fica no import e
+    # nas execuções seguintes o kernel carrega pronto do cache, com
+    # latência de chamada equivalente à de uma extensão AOT.
+    @njit("Tuple((int64, int64, float64))(float64[::1])", cache=True)
+    def _analyze_pct_jit(arr):
+        n = arr.size
+        pos = 0
+        neg = 0
+        total = 0.0
+        for i in range(n):
+            v = arr[i]
+            total += v
+            if v > 0.0:
+                pos += 1
+            elif v < 0.0:
+                neg += 1
+        avg = total / n if n else 0.0
+        return pos, neg, avg
+
+    def analyze_pct(arr: np.ndarray) -> tuple:
+        """Contar variações positivas/negativas e média em um único loop nativo
+
+        Args:
+            arr: array float64 de variações percentuais
+
+        Returns:
+            (positive_count, negative_count, average_change)
+        """
+        pos, neg, avg = _analyze_pct_jit(arr)
+        return int(pos), int(neg), float(avg)
+else:
+    analyze_pct = _analyze_pct_numpy
@@ -2,16 +2,30 @@
 MT5 Client - Application Use Cases
 Casos de uso seguindo Clean Architecture
 """
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from ..dtos import (
     GetSymbolsRequest, GetSymbolInfoRequest, GetTickersRequest,
-    GetTickersPosRequest, GetSymbolsPctChangeRequest, GetMarketDataRequest,
-    SearchSymbolsRequest, SymbolResponse, TickerResponse, 
-    SymbolPctChangeResponse, MarketDataResponse, ApiHealthResponse
+    GetTickersBatchRequest, GetTickersPosRequest, GetSymbolsPctChangeRequest,
+    GetMarketDataRequest, SearchSymbolsRequest, SymbolResponse, TickerResponse,
+    TickerArrayResponse, SymbolPctChangeResponse, MarketDataResponse,
+    ApiHealthResponse
 )
 from ...domain.repositories import IMT5Repository
+from .._kernels import analyze_pct
+
+# TTL do cache de metadados de símbolos: a lista muda no máximo uma vez
+# por sessão de pregão, então 5 minutos é conservador
+_SYMBOLS_CACHE_TTL = 300.0
+
+# TTL curto para health checks: absorve rajadas de sondas (load balancer,
+# dashboards) sem mascarar uma queda real por mais de um segundo
+_HEALTH_CACHE_TTL = 1.0
 
 
 class BaseUseCase(ABC):
@@ -33,10 +47,31 @@ class GetSymbolsUseCase(BaseUseCase):
     Single Responsibility: Apenas obter símbolos
     """
     
+    def __init__(self, repository: IMT5Repository):
+        super().__init__(repository)
+        self._cache: Optional[Tuple[float, List[SymbolResponse]]] = None
+
     async def execute(self, request: GetSymbolsRequest) -> List[SymbolResponse]:
-        """Executar caso de uso"""
-        symbols = await self._repository.symbols.get_all_symbols()
-        return [SymbolResponse.from_entity(symbol) for symbol in symbols]
+        """
+        Executar caso de uso
+
+        O resultado é memoizado por _SYMBOLS_CACHE_TTL segundos: chamadas
+        repetidas devolvem a mesma lista sem rede nem reconstrução de DTOs
+        (a lista retornada não deve ser mutada pelo chamador).
+        """
+        cached = self._cache
+        if cached is not None and time.monotonic() - cached[0] < _SYMBOLS_CACHE_TTL:
+            return cached[1]
+
+        try:
+            symbols = await self._repository.symbols.get_all_symbols()
+        except ConnectionError:
+            self._cache = None
+            raise
+
+        result = SymbolResponse.from_entities(symbols)
+        self._cache = (time.monotonic(), result)
+        return result
 
 
 class GetSymbolInfoUseCase(BaseUseCase):
@@ -46,14 +81,33 @@ class GetSymbolInfoUseCase(BaseUseCase):
     Single Responsibility: Apenas informações de símbolo
     """
     
+    def __init__(self, repository: IMT5Repository):
+        super().__init__(repository)
+        self._cache: Dict[str, Tuple[float, SymbolResponse]] = {}
+
     async def execute(self, request: GetSymbolInfoRequest) -> Optional[SymbolResponse]:
-        """Executar caso de uso"""
-        symbol = await self._repository.symbols.get_symbol_by_name(request.symbol)
+        """
+        Executar caso de uso
+
+        Informações de símbolo são memoizadas por _SYMBOLS_CACHE_TTL
+        segundos, por símbolo; só respostas encontradas entram no cache.
+        """
+        cached = self._cache.get(request.symbol)
+        if cached is not None and time.monotonic() - cached[0] < _SYMBOLS_CACHE_TTL:
+            return cached[1]
+
+        try:
+            symbol = await self._repository.symbols.get_symbol_by_name(request.symbol)
+        except ConnectionError:
+            self._cache.pop(request.symbol, None)
+            raise
         
         if symbol is None:
             return None
         
-        return SymbolResponse.from_entity(symbol)
+        response = SymbolResponse.from_entity(symbol)
+        self._cache[request.symbol] = (time.monotonic(), response)
+        return response
 
 
 class SearchSymbolsUseCase(BaseUseCase):
@@ -65,14 +119,13 @@ class SearchSymbolsUseCase(BaseUseCase):
     
     async def execute(self, request: SearchSymbolsRequest) -> List[SymbolResponse]:
         """Executar caso de uso"""
-        symbols = await self._repository.symbols.search_symbols(request.pattern)
-        
-        result = [SymbolResponse.from_entity(symbol) for symbol in symbols]
-        
-        if request.limit:
-            result = result[:request.limit]
+        # limit é empurrado para o repositório: não desperdiçamos rede nem
+        # construção de DTOs com linhas que seriam descartadas no fatiamento
+        symbols = await self._repository.symbols.search_symbols(
+            request.pattern, limit=request.limit
+        )
         
-        return result
+        return SymbolResponse.from_entities(symbols)
 
 
 class GetTickersUseCase(BaseUseCase):
@@ -91,7 +144,75 @@ class GetTickersUseCase(BaseUseCase):
             timeframe=request.timeframe
         )
         
-        return [TickerResponse.from_entity(ticker) for ticker in tickers]
+        return list(map(TickerResponse.from_entity, tickers))
+
+
+class IterTickersUseCase(BaseUseCase):
+    """
+    Caso de uso: Iterar cotações por período
+
+    Single Responsibility: Apenas o streaming de cotações
+    """
+
+    async def execute(self, request: GetTickersRequest) -> AsyncIterator[TickerResponse]:
+        """Executar caso de uso
+
+        Async generator: cada Ticker vira DTO assim que o repositório o
+        emite, sem materializar a lista do período inteiro.
+        """
+        tickers = self._repository.tickers.iter_tickers(
+            symbol=request.symbol,
+            date_from=request.date_from,
+            date_to=request.date_to,
+            timeframe=request.timeframe
+        )
+        async for ticker in tickers:
+            yield TickerResponse.from_entity(ticker)
+
+
+class GetTickersArrayUseCase(BaseUseCase):
+    """
+    Caso de uso: Obter cotações por período em layout colunar
+
+    Single Responsibility: Apenas cotações colunares (SoA)
+    """
+
+    async def execute(self, request: GetTickersRequest) -> TickerArrayResponse:
+        """Executar caso de uso
+
+        O repositório já preenche as colunas NumPy direto das linhas da
+        API; aqui só embrulhamos o lote no DTO, sem cópia.
+        """
+        batch = await self._repository.tickers.get_tickers_columns(
+            symbol=request.symbol,
+            date_from=request.date_from,
+            date_to=request.date_to,
+            timeframe=request.timeframe
+        )
+
+        return TickerArrayResponse.from_batch(batch)
+
+
+class GetTickersBatchUseCase(BaseUseCase):
+    """
+    Caso de uso: Obter cotações de múltiplos símbolos
+
+    Single Responsibility: Apenas cotações em lote
+    """
+
+    async def execute(self, request: GetTickersBatchRequest) -> Dict[str, List[TickerResponse]]:
+        """Executar caso de uso"""
+        tickers_by_symbol = await self._repository.tickers.get_tickers_by_period_batch(
+            symbols=request.symbols,
+            date_from=request.date_from,
+            date_to=request.date_to,
+            timeframe=request.timeframe
+        )
+
+        return {
+            symbol: list(map(TickerResponse.from_entity, tickers))
+            for symbol, tickers in tickers_by_symbol.items()
+        }
 
 
 class GetTickersPosUseCase(BaseUseCase):
@@ -109,7 +230,7 @@ class GetTickersPosUseCase(BaseUseCase):
             timeframe=request.timeframe
         )
         
-        return [TickerResponse.from_entity(ticker) for ticker in tickers]
+        return list(map(TickerResponse.from_entity, tickers))
 
 
 class GetSymbolsPctChangeUseCase(BaseUseCase):
@@ -126,7 +247,39 @@ class GetSymbolsPctChangeUseCase(BaseUseCase):
             timeframe=request.timeframe
         )
         
-        return [SymbolPctChangeResponse.from_entity(pct) for pct in pct_changes]
+        return list(map(SymbolPctChangeResponse.from_entity, pct_changes))
+
+
+class GetCurrentPricesUseCase(BaseUseCase):
+    """
+    Caso de uso: Obter preços atuais de múltiplos símbolos
+
+    Single Responsibility: Apenas preços atuais
+    """
+
+    async def execute(self, symbols: List[str]) -> Dict[str, float]:
+        """Executar caso de uso
+
+        Usa o RPC estreito do repositório de análise: só {símbolo: float}
+        trafega, sem montar dados de mercado completos por símbolo.
+        """
+        return await self._repository.analysis.get_current_prices(symbols)
+
+
+class StreamPricesUseCase(BaseUseCase):
+    """
+    Caso de uso: Assinar preços em tempo real
+
+    Single Responsibility: Apenas o stream de preços
+    """
+
+    def execute(self, symbols: List[str], interval: float = 1.0) -> AsyncIterator[Dict[str, float]]:
+        """Executar caso de uso
+
+        Devolve o async iterator do repositório: cada item é um mapa
+        {símbolo: preço} empurrado pelo servidor via WebSocket.
+        """
+        return self._repository.analysis.stream_prices(symbols, interval=interval)
 
 
 class GetMarketDataUseCase(BaseUseCase):
@@ -156,11 +309,22 @@ class GetMultipleMarketDataUseCase(BaseUseCase):
     Single Responsibility: Agregação de múltiplos símbolos
     """
     
-    async def execute(self, symbols: List[str]) -> List[MarketDataResponse]:
-        """Executar caso de uso"""
-        market_data_list = await self._repository.market_data.get_multiple_market_data(symbols)
-        
-        return [MarketDataResponse.from_entity(md) for md in market_data_list]
+    async def execute(self, symbols: List[str], concurrency: int = 16) -> List[MarketDataResponse]:
+        """Executar caso de uso
+
+        Args:
+            symbols: Símbolos a consultar
+            concurrency: Máximo de símbolos em voo simultaneamente
+        """
+        # Consumir na ordem de conclusão: cada entidade vira DTO assim que
+        # sua resposta chega, com a conversão escondida atrás da espera de
+        # rede dos símbolos ainda em voo (nada de rajada de parses no fim)
+        return [
+            MarketDataResponse.from_entity(market_data)
+            async for market_data in self._repository.market_data.iter_market_data(
+                symbols, concurrency=concurrency
+            )
+        ]
 
 
 class CheckApiHealthUseCase(BaseUseCase):
@@ -170,8 +334,40 @@ class CheckApiHealthUseCase(BaseUseCase):
     Single Responsibility: Apenas verificação de saúde
     """
     
+    def __init__(self, repository: IMT5Repository):
+        super().__init__(repository)
+        self._cached: Optional[Tuple[float, ApiHealthResponse]] = None
+        self._lock = asyncio.Lock()
+        # Contadores expostos para a aplicação inspecionar o cache
+        self.cache_stats = {"hits": 0, "misses": 0}
+
     async def execute(self) -> ApiHealthResponse:
-        """Executar caso de uso"""
+        """
+        Executar caso de uso
+
+        A resposta é memoizada por _HEALTH_CACHE_TTL segundos e as chamadas
+        concorrentes compartilham uma única ida à rede (single-flight via
+        lock): N sondas simultâneas custam um round-trip só.
+        """
+        cached = self._cached
+        if cached is not None and time.monotonic() - cached[0] < _HEALTH_CACHE_TTL:
+            self.cache_stats["hits"] += 1
+            return cached[1]
+
+        async with self._lock:
+            # Outra chamada pode ter renovado o cache enquanto esperávamos
+            cached = self._cached
+            if cached is not None and time.monotonic() - cached[0] < _HEALTH_CACHE_TTL:
+                self.cache_stats["hits"] += 1
+                return cached[1]
+
+            self.cache_stats["misses"] += 1
+            response = await self._fetch_health()
+            self._cached = (time.monotonic(), response)
+            return response
+
+    async def _fetch_health(self) -> ApiHealthResponse:
+        """Consultar a API e mapear a resposta de saúde"""
         health_response = await self._repository.health.check_health()
         
         if health_response.success and health_response.data:
@@ -210,23 +406,23 @@ class MarketAnalysisUseCase(BaseUseCase):
         - Estatísticas gerais
         - Tendências identificadas
         """
-        # Obter dados de mercado
-        market_data_list = await self._repository.market_data.get_multiple_market_data(symbols)
-        
-        # Obter variações percentuais
-        pct_changes = await self._repository.analysis.get_symbols_percent_change(
-            symbols, timeframe
+        # Dados de mercado e variações percentuais são I/O independentes —
+        # sobrepor as duas idas à rede corta o tempo total pela metade
+        market_data_list, pct_changes = await asyncio.gather(
+            self._repository.market_data.get_multiple_market_data(symbols),
+            self._repository.analysis.get_symbols_percent_change(symbols, timeframe)
         )
         
-        # Calcular estatísticas
-        valid_changes = [pct for pct in pct_changes if pct.is_valid]
+        # Calcular estatísticas: uma única passada extrai os valores
+        # válidos (error is None evita o despacho da property is_valid por
+        # elemento) e as reduções rodam fundidas no kernel compilado
+        valid_values = [float(pct.pct_change) for pct in pct_changes if pct.error is None]
         
-        if valid_changes:
-            positive_count = sum(1 for pct in valid_changes if pct.is_positive)
-            negative_count = sum(1 for pct in valid_changes if pct.is_negative)
-            total_count = len(valid_changes)
-            
-            avg_change = sum(pct.pct_change for pct in valid_changes) / total_count
+        if valid_values:
+            total_count = len(valid_values)
+
+            arr = np.fromiter(valid_values, dtype=np.float64, count=total_count)
+            positive_count, negative_count, avg_change = analyze_pct(arr)
             
             market_sentiment = "bullish" if positive_count > total_count * 0.6 else \
                               "bearish" if negative_count > total_count * 0.6 else "neutral"
@@ -236,11 +432,11 @@ class MarketAnalysisUseCase(BaseUseCase):
             positive_count = negative_count = total_count = 0
         
         return {
-            "market_data": [MarketDataResponse.from_entity(md) for md in market_data_list],
-            "percent_changes": [SymbolPctChangeResponse.from_entity(pct) for pct in pct_changes],
+            "market_data": list(map(MarketDataResponse.from_entity, market_data_list)),
+            "percent_changes": list(map(SymbolPctChangeResponse.from_entity, pct_changes)),
             "statistics": {
                 "total_symbols": len(symbols),
-                "valid_symbols": len(valid_changes),
+                "valid_symbols": total_count,
                 "positive_count": positive_count,
                 "negative_count": negative_count,
                 "average_change": float(avg_change),
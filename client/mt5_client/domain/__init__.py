@@ -7,6 +7,7 @@ Camada de domínio seguindo Clean Architecture
 from .entities import (
     Symbol,
     Ticker, 
+    TickerBatch,
     SymbolPercentChange,
     MarketData,
     ApiResponse
@@ -25,6 +26,7 @@ __all__ = [
     # Entities
     "Symbol",
     "Ticker",
+    "TickerBatch",
     "SymbolPercentChange", 
     "MarketData",
     "ApiResponse",
@@ -1,20 +1,46 @@
 """
 MT5 Client - Domain Entities
 Entidades de domínio seguindo Clean Architecture
+
+As entidades são msgspec.Struct congeladas: construção/igualdade/hash em
+nível C e layout compacto com slots, já que esses objetos são criados aos
+milhares em cada resposta da API.
 """
-from dataclasses import dataclass
+import msgspec
+import numpy as np
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, List, Optional
 from decimal import Decimal
 
+# Quando True, os __post_init__ de Ticker/SymbolPercentChange pulam a
+# validação. Ligado apenas via trusted_construction(), nos adaptadores que
+# mapeiam dados já verificados pela API em lotes grandes.
+_SKIP_VALIDATION = False
+
 
-@dataclass(frozen=True)
-class Symbol:
+@contextmanager
+def trusted_construction():
+    """Suprimir a validação de entidades para dados já verificados
+
+    Uso restrito à camada de infraestrutura, em loops síncronos de
+    mapeamento em lote (sem awaits no meio): os tipos já foram garantidos
+    pelo decode da resposta, então as comparações por linha são custo puro.
+    """
+    global _SKIP_VALIDATION
+    _SKIP_VALIDATION = True
+    try:
+        yield
+    finally:
+        _SKIP_VALIDATION = False
+
+
+class Symbol(msgspec.Struct, frozen=True, gc=False):
     """
     Entidade Symbol - Representa um símbolo de trading
     
     Single Responsibility: Apenas dados e lógica de negócio do símbolo
-    Immutable: Frozen dataclass para garantir integridade
+    Immutable: Struct congelado para garantir integridade
     """
     name: str
     description: str
@@ -26,29 +52,41 @@ class Symbol:
     volume_min: Optional[float] = None
     volume_max: Optional[float] = None
     trade_mode: Optional[int] = None
+    # Derivados calculados uma única vez no __post_init__ (ver abaixo)
+    _is_forex: bool = False
+    _precision: Decimal = Decimal(0)
     
     def __post_init__(self):
-        """Validação de regras de negócio"""
+        """Validação de regras de negócio e pré-cálculo de derivados"""
         if not self.name:
             raise ValueError("Symbol name cannot be empty")
         if self.digits < 0:
             raise ValueError("Digits must be non-negative")
         if self.point <= 0:
             raise ValueError("Point must be positive")
+
+        # is_forex e precision dependem só de name/digits, imutáveis:
+        # calcular uma vez aqui poupa um Decimal ** por acesso à property
+        # (force_setattr é a via do msgspec para escrever em Struct congelado)
+        msgspec.structs.force_setattr(
+            self, "_is_forex", len(self.name) == 6 and self.name.isalpha()
+        )
+        msgspec.structs.force_setattr(
+            self, "_precision", Decimal(10) ** (-self.digits)
+        )
     
     @property
     def is_forex(self) -> bool:
         """Verificar se é um par de moedas Forex"""
-        return len(self.name) == 6 and self.name.isalpha()
+        return self._is_forex
     
     @property
     def precision(self) -> Decimal:
         """Obter precisão baseada nos dígitos"""
-        return Decimal(10) ** (-self.digits)
+        return self._precision
 
 
-@dataclass(frozen=True)
-class Ticker:
+class Ticker(msgspec.Struct, frozen=True, gc=False):
     """
     Entidade Ticker - Representa uma cotação OHLCV
     
@@ -56,14 +94,16 @@ class Ticker:
     """
     symbol: str
     time: datetime
-    open: Decimal
-    high: Decimal
-    low: Decimal
-    close: Decimal
+    open: float
+    high: float
+    low: float
+    close: float
     volume: int
     
     def __post_init__(self):
         """Validação de regras de negócio"""
+        if _SKIP_VALIDATION:
+            return
         if not self.symbol:
             raise ValueError("Symbol cannot be empty")
         if self.high < self.low:
@@ -76,7 +116,7 @@ class Ticker:
             raise ValueError("Volume cannot be negative")
     
     @property
-    def body(self) -> Decimal:
+    def body(self) -> float:
         """Corpo da vela (diferença entre close e open)"""
         return self.close - self.open
     
@@ -96,34 +136,108 @@ class Ticker:
         return self.close == self.open
     
     @property
-    def range_value(self) -> Decimal:
+    def range_value(self) -> float:
         """Range da vela (high - low)"""
         return self.high - self.low
     
     @property
-    def upper_shadow(self) -> Decimal:
+    def upper_shadow(self) -> float:
         """Sombra superior"""
         return self.high - max(self.open, self.close)
     
     @property
-    def lower_shadow(self) -> Decimal:
+    def lower_shadow(self) -> float:
         """Sombra inferior"""
         return min(self.open, self.close) - self.low
 
+    def ohlc_as_decimal(self) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+        """OHLC como Decimal exato, para relatórios que exigem precisão decimal"""
+        return (
+            Decimal(str(self.open)),
+            Decimal(str(self.high)),
+            Decimal(str(self.low)),
+            Decimal(str(self.close)),
+        )
+
+
+class TickerBatch(msgspec.Struct, frozen=True):
+    """
+    Lote de cotações em layout Struct-of-Arrays
+
+    Em vez de N objetos Ticker, cada coluna OHLCV vive em um array NumPy
+    contíguo: memória por linha muito menor e reduções (min/max, médias,
+    retornos) viram operações vetorizadas. É a representação preferida
+    para lotes grandes vindos dos endpoints de período/posição.
+    """
+    symbol: str
+    time: np.ndarray      # datetime64[s]
+    open: np.ndarray      # float64
+    high: np.ndarray      # float64
+    low: np.ndarray       # float64
+    close: np.ndarray     # float64
+    volume: np.ndarray    # int64
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @classmethod
+    def from_tickers(cls, symbol: str, tickers: List['Ticker']) -> 'TickerBatch':
+        """Empacotar uma lista de Ticker em colunas contíguas"""
+        n = len(tickers)
+        return cls(
+            symbol=symbol,
+            time=np.array([t.time for t in tickers], dtype="datetime64[s]"),
+            open=np.fromiter((t.open for t in tickers), dtype=np.float64, count=n),
+            high=np.fromiter((t.high for t in tickers), dtype=np.float64, count=n),
+            low=np.fromiter((t.low for t in tickers), dtype=np.float64, count=n),
+            close=np.fromiter((t.close for t in tickers), dtype=np.float64, count=n),
+            volume=np.fromiter((t.volume for t in tickers), dtype=np.int64, count=n),
+        )
+
+    def price_range(self) -> Optional[tuple[float, float]]:
+        """Range de preços (min, max) do lote, vetorizado"""
+        if len(self.close) == 0:
+            return None
+        return float(self.low.min()), float(self.high.max())
+
+    def pct_changes(self) -> np.ndarray:
+        """Retornos percentuais entre fechamentos consecutivos"""
+        closes = self.close
+        if len(closes) < 2:
+            return np.empty(0, dtype=np.float64)
+        return np.diff(closes) / closes[:-1] * 100
+
+    def to_tickers(self) -> List['Ticker']:
+        """Rematerializar objetos Ticker (apenas para consumidores por linha)"""
+        times = self.time.astype("datetime64[us]").astype(datetime)
+        return [
+            Ticker(
+                symbol=self.symbol,
+                time=times[i],
+                open=float(self.open[i]),
+                high=float(self.high[i]),
+                low=float(self.low[i]),
+                close=float(self.close[i]),
+                volume=int(self.volume[i]),
+            )
+            for i in range(len(times))
+        ]
+
 
-@dataclass(frozen=True)
-class SymbolPercentChange:
+class SymbolPercentChange(msgspec.Struct, frozen=True, gc=False):
     """
     Entidade para variação percentual de símbolos
     
     Single Responsibility: Dados de variação percentual e análises
     """
     symbol: str
-    pct_change: Decimal
+    pct_change: float
     error: Optional[str] = None
     
     def __post_init__(self):
         """Validação"""
+        if _SKIP_VALIDATION:
+            return
         if not self.symbol:
             raise ValueError("Symbol cannot be empty")
     
@@ -165,8 +279,7 @@ class SymbolPercentChange:
             return "MINIMAL"
 
 
-@dataclass(frozen=True)
-class MarketData:
+class MarketData(msgspec.Struct, frozen=True):
     """
     Entidade agregada para dados de mercado
     
@@ -196,7 +309,7 @@ class MarketData:
         return self.latest_ticker is not None or (self.tickers is not None and len(self.tickers) > 0)
     
     @property
-    def current_price(self) -> Optional[Decimal]:
+    def current_price(self) -> Optional[float]:
         """Obter preço atual"""
         if self.latest_ticker:
             return self.latest_ticker.close
@@ -204,26 +317,35 @@ class MarketData:
             return self.tickers[-1].close  # Último ticker
         return None
     
-    def calculate_price_range(self) -> Optional[tuple[Decimal, Decimal]]:
+    def calculate_price_range(self) -> Optional[tuple[float, float]]:
         """Calcular range de preços (min, max) dos tickers"""
-        if not self.tickers:
+        tickers = self.tickers
+        if not tickers:
             return None
         
-        lows = [ticker.low for ticker in self.tickers]
-        highs = [ticker.high for ticker in self.tickers]
+        # Uma única passada pelos tickers, sem materializar listas
+        # intermediárias de lows/highs
+        lo = tickers[0].low
+        hi = tickers[0].high
+        for ticker in tickers:
+            low = ticker.low
+            high = ticker.high
+            if low < lo:
+                lo = low
+            if high > hi:
+                hi = high
         
-        return min(lows), max(highs)
+        return lo, hi
 
 
-@dataclass(frozen=True)
-class ApiResponse:
+class ApiResponse(msgspec.Struct, frozen=True):
     """
     Entidade para resposta da API
     
     Single Responsibility: Encapsular resposta da API com metadados
     """
     success: bool
-    data: Optional[any] = None
+    data: Optional[Dict[str, Any]] = None
     error_message: Optional[str] = None
     timestamp: Optional[datetime] = None
     
@@ -240,7 +362,7 @@ class ApiResponse:
         return self.success and self.data is not None
     
     @classmethod
-    def success_response(cls, data: any, timestamp: datetime = None) -> 'ApiResponse':
+    def success_response(cls, data: Dict[str, Any], timestamp: Optional[datetime] = None) -> 'ApiResponse':
         """Factory method para resposta de sucesso"""
         return cls(
             success=True,
@@ -249,7 +371,7 @@ class ApiResponse:
         )
     
     @classmethod
-    def error_response(cls, error_message: str, timestamp: datetime = None) -> 'ApiResponse':
+    def error_response(cls, error_message: str, timestamp: Optional[datetime] = None) -> 'ApiResponse':
         """Factory method para resposta de erro"""
         return cls(
             success=False,
@@ -3,10 +3,10 @@ MT5 Client - Domain Repositories
 Interfaces para acesso a dados seguindo Clean Architecture
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
-from ..entities import Symbol, Ticker, SymbolPercentChange, MarketData, ApiResponse
+from ..entities import Symbol, Ticker, TickerBatch, SymbolPercentChange, MarketData, ApiResponse
 
 
 class ISymbolRepository(ABC):
@@ -28,8 +28,8 @@ class ISymbolRepository(ABC):
         pass
     
     @abstractmethod
-    async def search_symbols(self, pattern: str) -> List[Symbol]:
-        """Buscar símbolos por padrão"""
+    async def search_symbols(self, pattern: str, limit: Optional[int] = None) -> List[Symbol]:
+        """Buscar símbolos por padrão (limit empurra o corte para a fonte)"""
         pass
 
 
@@ -51,10 +51,43 @@ class ITickerRepository(ABC):
         """Obter cotações por período específico"""
         pass
     
+    @abstractmethod
+    async def get_tickers_columns(
+        self,
+        symbol: str,
+        date_from: datetime,
+        date_to: datetime,
+        timeframe: int = 1
+    ) -> TickerBatch:
+        """Obter cotações por período em layout colunar (SoA)"""
+        pass
+
+    @abstractmethod
+    async def get_tickers_by_period_batch(
+        self,
+        symbols: List[str],
+        date_from: datetime,
+        date_to: datetime,
+        timeframe: int = 1
+    ) -> Dict[str, List[Ticker]]:
+        """Obter cotações de múltiplos símbolos em uma única requisição"""
+        pass
+
+    @abstractmethod
+    def iter_tickers(
+        self,
+        symbol: str,
+        date_from: datetime,
+        date_to: datetime,
+        timeframe: int = 1
+    ):
+        """Iterar cotações do período conforme chegam da rede"""
+        pass
+
     @abstractmethod
     async def get_latest_tickers(
-        self, 
-        symbol: str, 
+        self,
+        symbol: str,
         count: int = 10,
         timeframe: int = 1
     ) -> List[Ticker]:
@@ -85,13 +118,23 @@ class IMarketAnalysisRepository(ABC):
     
     @abstractmethod
     async def get_symbol_percent_change(
-        self, 
+        self,
         symbol: str,
         timeframe: int = 1
     ) -> Optional[SymbolPercentChange]:
         """Obter variação percentual de um símbolo"""
         pass
 
+    @abstractmethod
+    async def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Obter preços atuais (último fechamento) de múltiplos símbolos"""
+        pass
+
+    @abstractmethod
+    def stream_prices(self, symbols: List[str], interval: float = 1.0):
+        """Assinar preços via WebSocket (itera mapas {símbolo: preço})"""
+        pass
+
 
 class IMarketDataRepository(ABC):
     """
@@ -107,8 +150,21 @@ class IMarketDataRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_multiple_market_data(self, symbol_names: List[str]) -> List[MarketData]:
-        """Obter dados de mercado para múltiplos símbolos"""
+    async def get_multiple_market_data(
+        self,
+        symbol_names: List[str],
+        concurrency: int = 10
+    ) -> List[MarketData]:
+        """Obter dados de mercado para múltiplos símbolos (fan-out limitado)"""
+        pass
+
+    @abstractmethod
+    def iter_market_data(
+        self,
+        symbol_names: List[str],
+        concurrency: int = 10
+    ):
+        """Iterar dados de mercado na ordem em que ficam prontos"""
         pass
 
 
@@ -7,12 +7,16 @@ from typing import Optional
 
 from .config import ApiConfig
 from .adapters import (
-    HttpClient, SymbolRepositoryAdapter, TickerRepositoryAdapter,
-    MarketAnalysisRepositoryAdapter, MarketDataRepositoryAdapter, 
+    HttpClient, HttpxClient, SymbolRepositoryAdapter, TickerRepositoryAdapter,
+    MarketAnalysisRepositoryAdapter, MarketDataRepositoryAdapter,
     HealthRepositoryAdapter
 )
 from ..domain.repositories import IMT5Repository
 
+# Logger único do módulo (ver adapters: evita o lookup de getLogger
+# a cada construção)
+_logger = logging.getLogger(__name__)
+
 
 class MT5Repository(IMT5Repository):
     """
@@ -21,93 +25,60 @@ class MT5Repository(IMT5Repository):
     Facade Pattern: Interface unificada para todos os repositórios
     Dependency Inversion: Implementa interface abstrata
     Single Responsibility: Agregar repositórios específicos
+
+    Os sub-repositórios são atributos planos resolvidos uma única vez no
+    __init__ (construí-los é barato e síncrono — só a sessão HTTP é
+    assíncrona). Atributo plano em vez de property lazy poupa um despacho
+    de descritor em cada entrada de caso de uso; a interface abstrata
+    mantém as properties como contrato, que Python aceita satisfazer com
+    atributos de instância.
     """
+
+    # Sobrescrever os nomes abstratos no corpo da classe; os valores reais
+    # são atribuídos por instância no __init__
+    symbols: SymbolRepositoryAdapter = None
+    tickers: TickerRepositoryAdapter = None
+    analysis: MarketAnalysisRepositoryAdapter = None
+    market_data: MarketDataRepositoryAdapter = None
+    health: HealthRepositoryAdapter = None
     
     def __init__(self, config: ApiConfig):
         self.config = config
-        self.logger = logging.getLogger(__name__)
+        self.logger = _logger
         
-        # HTTP Client compartilhado
-        self._http_client: Optional[HttpClient] = None
+        # HTTP Client compartilhado (a sessão em si é criada sob demanda);
+        # backend httpx opcional para gateways HTTP/2
+        if config.http_backend == "httpx":
+            self._http_client = HttpxClient(config)
+        else:
+            self._http_client = HttpClient(config)
         
-        # Repositórios específicos
-        self._symbols_repo: Optional[SymbolRepositoryAdapter] = None
-        self._tickers_repo: Optional[TickerRepositoryAdapter] = None
-        self._analysis_repo: Optional[MarketAnalysisRepositoryAdapter] = None
-        self._market_data_repo: Optional[MarketDataRepositoryAdapter] = None
-        self._health_repo: Optional[HealthRepositoryAdapter] = None
-    
+        # Repositórios específicos, resolvidos uma única vez
+        self.symbols = SymbolRepositoryAdapter(self._http_client)
+        self.tickers = TickerRepositoryAdapter(self._http_client)
+        self.analysis = MarketAnalysisRepositoryAdapter(self._http_client)
+        self.market_data = MarketDataRepositoryAdapter(
+            self.symbols, self.tickers, self.analysis
+        )
+        self.health = HealthRepositoryAdapter(self._http_client)
+
+        # Contagem de contextos ativos: permite aninhar/compartilhar o mesmo
+        # repositório entre vários `async with` sem que o primeiro __aexit__
+        # derrube a sessão (e o pool de conexões aquecido) dos demais
+        self._context_count = 0
+
     async def __aenter__(self):
         """Async context manager entry"""
-        await self._ensure_http_client()
+        self._context_count += 1
+        await self._http_client._ensure_session()
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        await self.close()
-    
-    async def _ensure_http_client(self):
-        """Garantir que o cliente HTTP está inicializado"""
-        if self._http_client is None:
-            self._http_client = HttpClient(self.config)
-            await self._http_client._ensure_session()
-    
+        self._context_count = max(0, self._context_count - 1)
+        if self._context_count == 0:
+            await self.close()
+
     async def close(self):
-        """Fechar recursos"""
-        if self._http_client:
-            await self._http_client.close()
-            self._http_client = None
-        
-        # Reset repositories
-        self._symbols_repo = None
-        self._tickers_repo = None
-        self._analysis_repo = None
-        self._market_data_repo = None
-        self._health_repo = None
-    
-    @property
-    def symbols(self) -> SymbolRepositoryAdapter:
-        """Acesso ao repositório de símbolos"""
-        if self._symbols_repo is None:
-            if self._http_client is None:
-                raise RuntimeError("Repository not initialized. Use async context manager.")
-            self._symbols_repo = SymbolRepositoryAdapter(self._http_client)
-        return self._symbols_repo
-    
-    @property
-    def tickers(self) -> TickerRepositoryAdapter:
-        """Acesso ao repositório de cotações"""
-        if self._tickers_repo is None:
-            if self._http_client is None:
-                raise RuntimeError("Repository not initialized. Use async context manager.")
-            self._tickers_repo = TickerRepositoryAdapter(self._http_client)
-        return self._tickers_repo
-    
-    @property
-    def analysis(self) -> MarketAnalysisRepositoryAdapter:
-        """Acesso ao repositório de análises"""
-        if self._analysis_repo is None:
-            if self._http_client is None:
-                raise RuntimeError("Repository not initialized. Use async context manager.")
-            self._analysis_repo = MarketAnalysisRepositoryAdapter(self._http_client)
-        return self._analysis_repo
-    
-    @property
-    def market_data(self) -> MarketDataRepositoryAdapter:
-        """Acesso ao repositório de dados de mercado"""
-        if self._market_data_repo is None:
-            if self._http_client is None:
-                raise RuntimeError("Repository not initialized. Use async context manager.")
-            self._market_data_repo = MarketDataRepositoryAdapter(
-                self.symbols, self.tickers, self.analysis
-            )
-        return self._market_data_repo
-    
-    @property
-    def health(self) -> HealthRepositoryAdapter:
-        """Acesso ao repositório de saúde"""
-        if self._health_repo is None:
-            if self._http_client is None:
-                raise RuntimeError("Repository not initialized. Use async context manager.")
-            self._health_repo = HealthRepositoryAdapter(self._http_client)
-        return self._health_repo
\ No newline at end of file
+        """Fechar recursos (a sessão reabre sob demanda se reutilizado)"""
+        await self._http_client.close()
\ No newline at end of file
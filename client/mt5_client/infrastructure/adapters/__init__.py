@@ -3,20 +3,72 @@ MT5 Client - Infrastructure Adapters
 Adaptadores para comunicação externa seguindo Clean Architecture
 """
 import asyncio
+import fnmatch
 import logging
-from typing import List, Optional, Dict, Any
+import random
+import re
+import time
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime
-from decimal import Decimal
 import aiohttp
 import json
+import msgspec
 
 from ..config import ApiConfig
-from ...domain.entities import Symbol, Ticker, SymbolPercentChange, MarketData, ApiResponse
+import numpy as np
+
+from ...domain.entities import (
+    Symbol, Ticker, TickerBatch, SymbolPercentChange, MarketData, ApiResponse,
+    trusted_construction
+)
 from ...domain.repositories import (
     ISymbolRepository, ITickerRepository, IMarketAnalysisRepository,
     IMarketDataRepository, IHealthRepository, IMT5Repository
 )
 
+# Logger único do módulo: getLogger devolve sempre o mesmo singleton,
+# mas paga um lookup com lock; resolver uma vez no import evita pagá-lo
+# a cada construção de adaptador
+_logger = logging.getLogger(__name__)
+
+# Decoder MessagePack compartilhado (criado uma vez por processo)
+_MSGPACK_DECODER = msgspec.msgpack.Decoder()
+_MSGPACK_CONTENT_TYPES = ("application/msgpack", "application/x-msgpack")
+
+# orjson decodifica JSON em C, várias vezes mais rápido que o json da
+# stdlib em payloads grandes (listas de tickers/símbolos); se não estiver
+# instalado, o caminho stdlib continua funcionando igual
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# pandas é opcional (extra "frame"): necessário apenas para
+# get_tickers_frame, que entrega o período como DataFrame
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# ijson é opcional (extra "stream"): parse incremental de respostas
+# grandes sem bufferizar o corpo inteiro em memória
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# httpx é opcional (extra "http2"): transporte alternativo com
+# multiplexação HTTP/2 (ApiConfig.http_backend = "httpx")
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 
 class HttpClient:
     """
@@ -28,24 +80,49 @@ class HttpClient:
     
     def __init__(self, config: ApiConfig):
         self.config = config
-        self.logger = logging.getLogger(__name__)
+        self.logger = _logger
         self._session: Optional[aiohttp.ClientSession] = None
-    
+        self._session_lock = asyncio.Lock()
+
     async def __aenter__(self):
         """Async context manager entry"""
         await self._ensure_session()
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         await self.close()
-    
+
     async def _ensure_session(self):
-        """Garantir que a sessão está criada"""
-        if self._session is None or self._session.closed:
+        """Garantir que a sessão está criada
+
+        Lock com double-check: sob rajadas concorrentes de primeira
+        requisição (fan-out de get_multiple_market_data), sem o lock
+        várias corrotinas criariam sessões e as perdedoras vazariam. O
+        fast-path fora do lock mantém o custo zero no regime permanente.
+        """
+        if self._session is not None and not self._session.closed:
+            return
+
+        async with self._session_lock:
+            if self._session is not None and not self._session.closed:
+                return
+
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            connector = aiohttp.TCPConnector(verify_ssl=self.config.verify_ssl)
-            
+            # Pool dimensionado para suportar fan-out concorrente (gather)
+            # sem esgotar as conexões default do aiohttp. keepalive longo
+            # evita refazer handshake TCP/TLS após pausas curtas de tráfego,
+            # e enable_cleanup_closed recolhe sockets TLS meio-fechados
+            connector = aiohttp.TCPConnector(
+                verify_ssl=self.config.verify_ssl,
+                limit=self.config.max_connections,
+                limit_per_host=self.config.max_connections_per_host,
+                keepalive_timeout=self.config.keepalive_timeout,
+                enable_cleanup_closed=True,
+                use_dns_cache=True,
+                ttl_dns_cache=300
+            )
+
             self._session = aiohttp.ClientSession(
                 timeout=timeout,
                 connector=connector,
@@ -57,68 +134,284 @@ class HttpClient:
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
+
+    def _backoff_delay(self, attempt: int, error: Optional[Exception] = None) -> float:
+        """Calcular a espera antes da próxima tentativa
+
+        Backoff exponencial com full jitter: espera uniforme em
+        [0, min(retry_cap, retry_delay * 2^attempt)]. O jitter espalha os
+        retries de chamadas concorrentes no tempo em vez de sincronizá-las
+        em ondas contra um servidor já sobrecarregado. Se o servidor
+        enviou Retry-After (429/503), esse valor tem precedência.
+        """
+        if isinstance(error, aiohttp.ClientResponseError) and error.status in (429, 503):
+            retry_after = (error.headers or {}).get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), self.config.retry_cap)
+                except ValueError:
+                    pass
+        ceiling = min(self.config.retry_cap, self.config.retry_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    async def _parse_response(self, response: aiohttp.ClientResponse) -> Dict[str, Any]:
+        """Decodificar o corpo conforme o Content-Type negociado
+
+        O cliente anuncia application/msgpack no Accept; servidores que
+        suportam respondem MessagePack (decodificação mais barata e corpo
+        menor) e os demais continuam respondendo JSON.
+        """
+        content_type = response.headers.get("Content-Type", "")
+        body = await response.read()
+        if content_type.startswith(_MSGPACK_CONTENT_TYPES):
+            return _MSGPACK_DECODER.decode(body)
+        return _json_loads(body)
     
-    async def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Fazer requisição POST"""
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Executar requisição HTTP com retry e backoff
+
+        Caminho único para POST e GET: a URL é montada uma vez fora do
+        loop e os parâmetros de retry são lidos uma vez para locais, em
+        vez de reconsultar self.config a cada tentativa.
+        """
         await self._ensure_session()
-        
-        url = f"{self.config.base_url.rstrip('/')}/{endpoint.strip('/')}"
-        
-        for attempt in range(self.config.max_retries):
+
+        url = self.config._base_url_clean + "/" + endpoint.strip("/")
+        max_retries = self.config.max_retries
+
+        # Serializar o corpo uma vez, fora do loop de retry, com orjson
+        # quando disponível (2-3x mais rápido que o json.dumps que o
+        # aiohttp usaria); o Content-Type já vem dos headers da sessão
+        body = _json_dumps(json) if json is not None else None
+
+        for attempt in range(max_retries):
             try:
-                self.logger.debug(f"POST {url} - Attempt {attempt + 1}")
-                
-                async with self._session.post(url, json=data) as response:
+                self.logger.debug(f"{method} {url} - Attempt {attempt + 1}")
+
+                async with self._session.request(method, url, data=body) as response:
                     response.raise_for_status()
-                    result = await response.json()
-                    
-                    self.logger.debug(f"POST {url} - Success")
+                    result = await self._parse_response(response)
+
+                    self.logger.debug(f"{method} {url} - Success")
                     return result
-                    
+
             except asyncio.TimeoutError:
-                self.logger.warning(f"POST {url} - Timeout (attempt {attempt + 1})")
-                if attempt == self.config.max_retries - 1:
+                self.logger.warning(f"{method} {url} - Timeout (attempt {attempt + 1})")
+                if attempt == max_retries - 1:
                     raise
-                await asyncio.sleep(self.config.retry_delay)
-                
+                await asyncio.sleep(self._backoff_delay(attempt))
+
             except aiohttp.ClientError as e:
-                self.logger.error(f"POST {url} - Client error: {e}")
-                if attempt == self.config.max_retries - 1:
+                self.logger.error(f"{method} {url} - Client error: {e}")
+                if attempt == max_retries - 1:
                     raise
-                await asyncio.sleep(self.config.retry_delay)
-        
-        raise Exception(f"Failed to POST {url} after {self.config.max_retries} attempts")
-    
+                await asyncio.sleep(self._backoff_delay(attempt, e))
+
+        raise Exception(f"Failed to {method} {url} after {max_retries} attempts")
+
+    async def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Fazer requisição POST"""
+        return await self._request("POST", endpoint, json=data)
+
+    async def post_stream(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        item_path: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Fazer POST e iterar itens do JSON conforme chegam da rede
+
+        Parse incremental com ijson sobre response.content: o pico de
+        memória fica em O(item) em vez de O(corpo inteiro), e o parse
+        anda em paralelo com o recebimento. Sem loop de retry — um stream
+        parcialmente consumido não pode ser retomado com segurança.
+
+        Args:
+            endpoint: Endpoint da API
+            data: Payload JSON
+            item_path: Caminho ijson dos itens (ex: 'Resposta.tickers.item')
+        """
+        if ijson is None:
+            raise ImportError(
+                "ijson é necessário para post_stream "
+                "(pip install mt5-trading-client[stream])"
+            )
+
+        await self._ensure_session()
+
+        url = self.config._base_url_clean + "/" + endpoint.strip("/")
+        body = _json_dumps(data)
+
+        self.logger.debug(f"POST {url} - Streaming")
+        async with self._session.post(url, data=body) as response:
+            response.raise_for_status()
+            async for item in ijson.items_async(response.content, item_path):
+                yield item
+
     async def get(self, endpoint: str) -> Dict[str, Any]:
         """Fazer requisição GET"""
+        return await self._request("GET", endpoint)
+
+    async def ws_connect(self, endpoint: str):
+        """Abrir uma conexão WebSocket com o endpoint
+
+        Retorna o context manager do aiohttp (usar com `async with`).
+        A URL http(s) da config é trocada por ws(s) automaticamente.
+        """
         await self._ensure_session()
-        
-        url = f"{self.config.base_url.rstrip('/')}/{endpoint.strip('/')}"
-        
-        for attempt in range(self.config.max_retries):
+
+        url = self.config._base_url_clean + "/" + endpoint.strip("/")
+        if url.startswith("https://"):
+            url = "wss://" + url[len("https://"):]
+        elif url.startswith("http://"):
+            url = "ws://" + url[len("http://"):]
+
+        self.logger.debug(f"WS {url}")
+        return self._session.ws_connect(url)
+
+
+class HttpxClient:
+    """
+    Cliente HTTP alternativo sobre httpx com HTTP/2
+
+    Mesma interface post/get do HttpClient. Contra um gateway HTTP/2, as
+    chamadas paralelas de get_multiple_market_data são multiplexadas em
+    streams de uma única conexão TCP, em vez de disputarem o pool —
+    menos handshakes e sem head-of-line blocking no limite do pool.
+
+    Requer httpx instalado (extra "http2"); selecionado via
+    ApiConfig.http_backend = "httpx".
+    """
+
+    def __init__(self, config: ApiConfig):
+        if httpx is None:
+            raise ImportError(
+                "httpx é necessário para o backend http2 "
+                "(pip install mt5-trading-client[http2])"
+            )
+        self.config = config
+        self.logger = _logger
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._client_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+
+    async def _ensure_session(self):
+        """Garantir que o cliente está criado (double-check sob lock)"""
+        if self._client is not None and not self._client.is_closed:
+            return
+
+        async with self._client_lock:
+            if self._client is not None and not self._client.is_closed:
+                return
+
+            # Connection é header de conexão HTTP/1.1; em h2 é proibido
+            headers = {
+                key: value for key, value in self.config.get_headers().items()
+                if key.lower() != "connection"
+            }
+            self._client = httpx.AsyncClient(
+                http2=True,
+                base_url=self.config._base_url_clean,
+                headers=headers,
+                timeout=self.config.timeout,
+                verify=self.config.verify_ssl,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_connections_per_host,
+                    keepalive_expiry=self.config.keepalive_timeout
+                )
+            )
+
+    async def close(self):
+        """Fechar cliente HTTP"""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+            self._client = None
+
+    def _backoff_delay(self, attempt: int, error: Optional[Exception] = None) -> float:
+        """Backoff exponencial com full jitter (ver HttpClient)"""
+        if isinstance(error, httpx.HTTPStatusError) and error.response.status_code in (429, 503):
+            retry_after = error.response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), self.config.retry_cap)
+                except ValueError:
+                    pass
+        ceiling = min(self.config.retry_cap, self.config.retry_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def _parse_response(self, response: "httpx.Response") -> Dict[str, Any]:
+        """Decodificar o corpo conforme o Content-Type negociado"""
+        content_type = response.headers.get("Content-Type", "")
+        if content_type.startswith(_MSGPACK_CONTENT_TYPES):
+            return _MSGPACK_DECODER.decode(response.content)
+        return _json_loads(response.content)
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Executar requisição HTTP com retry e backoff"""
+        await self._ensure_session()
+
+        path = "/" + endpoint.strip("/")
+        max_retries = self.config.max_retries
+        body = _json_dumps(json) if json is not None else None
+
+        for attempt in range(max_retries):
             try:
-                self.logger.debug(f"GET {url} - Attempt {attempt + 1}")
-                
-                async with self._session.get(url) as response:
-                    response.raise_for_status()
-                    result = await response.json()
-                    
-                    self.logger.debug(f"GET {url} - Success")
-                    return result
-                    
-            except asyncio.TimeoutError:
-                self.logger.warning(f"GET {url} - Timeout (attempt {attempt + 1})")
-                if attempt == self.config.max_retries - 1:
+                self.logger.debug(f"{method} {path} - Attempt {attempt + 1}")
+
+                response = await self._client.request(method, path, content=body)
+                response.raise_for_status()
+                result = self._parse_response(response)
+
+                self.logger.debug(f"{method} {path} - Success")
+                return result
+
+            except httpx.TimeoutException:
+                self.logger.warning(f"{method} {path} - Timeout (attempt {attempt + 1})")
+                if attempt == max_retries - 1:
                     raise
-                await asyncio.sleep(self.config.retry_delay)
-                
-            except aiohttp.ClientError as e:
-                self.logger.error(f"GET {url} - Client error: {e}")
-                if attempt == self.config.max_retries - 1:
+                await asyncio.sleep(self._backoff_delay(attempt))
+
+            except httpx.HTTPError as e:
+                self.logger.error(f"{method} {path} - Client error: {e}")
+                if attempt == max_retries - 1:
                     raise
-                await asyncio.sleep(self.config.retry_delay)
-        
-        raise Exception(f"Failed to GET {url} after {self.config.max_retries} attempts")
+                await asyncio.sleep(self._backoff_delay(attempt, e))
+
+        raise Exception(f"Failed to {method} {path} after {max_retries} attempts")
+
+    async def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Fazer requisição POST"""
+        return await self._request("POST", endpoint, json=data)
+
+    async def get(self, endpoint: str) -> Dict[str, Any]:
+        """Fazer requisição GET"""
+        return await self._request("GET", endpoint)
+
+    async def ws_connect(self, endpoint: str):
+        """WebSockets não são suportados pelo backend httpx"""
+        raise NotImplementedError(
+            "stream de preços requer o backend aiohttp "
+            "(ApiConfig.http_backend = 'aiohttp')"
+        )
 
 
 class SymbolRepositoryAdapter(ISymbolRepository):
@@ -131,53 +424,169 @@ class SymbolRepositoryAdapter(ISymbolRepository):
     
     def __init__(self, http_client: HttpClient):
         self.http_client = http_client
-        self.logger = logging.getLogger(__name__)
-    
+        self.logger = _logger
+        # Índice de busca memoizado: (nome maiúsculo, descrição maiúscula,
+        # símbolo). Reconstruído apenas quando a lista de símbolos muda
+        self._search_index: Optional[List[tuple]] = None
+        self._search_index_source: Optional[List[Symbol]] = None
+        # Memoização com TTL no próprio adaptador: em fluxos de trading o
+        # mesmo símbolo é consultado dezenas de vezes por minuto, e o
+        # catálogo completo muda ainda menos. O lock evita dogpile: só uma
+        # corrotina busca na rede enquanto as demais aguardam o resultado
+        self._cache_ttl = 60.0
+        self._symbol_cache: Dict[str, Tuple[float, Symbol]] = {}
+        self._symbol_locks: Dict[str, asyncio.Lock] = {}
+        self._symbols_cache: Optional[Tuple[float, List[Symbol]]] = None
+        self._symbols_lock = asyncio.Lock()
+        # Servidores mais antigos não têm /SearchSymbols/; após o primeiro
+        # 404 a busca passa direto ao filtro local, sem retentar o endpoint
+        self._server_search_supported = True
+
     async def get_all_symbols(self) -> List[Symbol]:
-        """Obter todos os símbolos"""
+        """Obter todos os símbolos (cache single-slot com TTL)"""
+        cached = self._symbols_cache
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        async with self._symbols_lock:
+            # Double-check: outra corrotina pode ter preenchido o cache
+            # enquanto esta aguardava o lock
+            cached = self._symbols_cache
+            if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+                return cached[1]
+
+            symbols = await self._fetch_all_symbols()
+            self._symbols_cache = (time.monotonic(), symbols)
+            return symbols
+
+    async def _fetch_all_symbols(self) -> List[Symbol]:
+        """Buscar o catálogo completo na rede"""
         try:
             response = await self.http_client.post("/GetSymbols/", {})
-            
+
             if not response.get("OK"):
                 raise Exception(f"API Error: {response.get('Error', 'Unknown error')}")
-            
+
             symbols_data = response.get("Resposta", {}).get("symbols", [])
-            
+
             return [self._map_to_symbol(symbol_data) for symbol_data in symbols_data]
-            
+
         except Exception as e:
             self.logger.error(f"Error getting symbols: {e}")
             raise
-    
+
     async def get_symbol_by_name(self, symbol_name: str) -> Optional[Symbol]:
-        """Obter símbolo por nome"""
+        """Obter símbolo por nome (memoizado por nome com TTL)"""
+        cached = self._symbol_cache.get(symbol_name)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        lock = self._symbol_locks.setdefault(symbol_name, asyncio.Lock())
+        async with lock:
+            cached = self._symbol_cache.get(symbol_name)
+            if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+                return cached[1]
+
+            symbol = await self._fetch_symbol_by_name(symbol_name)
+            if symbol is not None:
+                # Ausências não são cacheadas: símbolo pode aparecer depois
+                self._symbol_cache[symbol_name] = (time.monotonic(), symbol)
+            return symbol
+
+    async def _fetch_symbol_by_name(self, symbol_name: str) -> Optional[Symbol]:
+        """Buscar um símbolo específico na rede"""
         try:
             response = await self.http_client.post("/GetSymbolInfo/", {
                 "symbol": symbol_name
             })
-            
+
             if not response.get("OK"):
                 self.logger.warning(f"Symbol {symbol_name} not found")
                 return None
-            
+
             symbol_data = response.get("Resposta", {})
             return self._map_to_symbol(symbol_data)
-            
+
         except Exception as e:
             self.logger.error(f"Error getting symbol {symbol_name}: {e}")
             raise
     
-    async def search_symbols(self, pattern: str) -> List[Symbol]:
-        """Buscar símbolos por padrão"""
-        # Para simulação, obtemos todos e filtramos
+    async def search_symbols(self, pattern: str, limit: Optional[int] = None) -> List[Symbol]:
+        """Buscar símbolos por padrão (substring ou glob com * e ?)"""
+        # Cache de símbolos quente: responder localmente, trocando um
+        # round-trip HTTP (~dezenas de ms) por uma varredura de ~1 ms
+        # sobre o índice já normalizado
+        cached = self._symbols_cache
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return self._search_local(cached[1], pattern, limit)
+
+        # Cache frio: preferir a busca no servidor, que trafega só os
+        # matches em vez do catálogo completo (O(matches) bytes, não O(N))
+        if self._server_search_supported:
+            try:
+                response = await self.http_client.post("/SearchSymbols/", {
+                    "pattern": pattern,
+                    "limit": limit
+                })
+                if response.get("OK"):
+                    symbols_data = response.get("Resposta", {}).get("symbols", [])
+                    return [self._map_to_symbol(symbol_data) for symbol_data in symbols_data]
+            except aiohttp.ClientResponseError as e:
+                if e.status in (400, 404):
+                    self.logger.info("Server lacks /SearchSymbols/, falling back to local filter")
+                    self._server_search_supported = False
+                else:
+                    raise
+
+        # Fallback local: obtemos todos e filtramos com corte antecipado
         all_symbols = await self.get_all_symbols()
+        return self._search_local(all_symbols, pattern, limit)
+
+    def _search_local(
+        self,
+        all_symbols: List[Symbol],
+        pattern: str,
+        limit: Optional[int] = None
+    ) -> List[Symbol]:
+        """Filtrar o catálogo em memória com corte antecipado
+
+        Com limit, a varredura para assim que houver resultados
+        suficientes, sem testar (nem materializar) o resto do catálogo.
+        """
+        # O .upper() de nome/descrição é pago uma vez por símbolo na
+        # (re)construção do índice, não a cada busca; buscas repetidas só
+        # fazem comparações de substring sobre strings já normalizadas
+        if self._search_index is None or self._search_index_source is not all_symbols:
+            self._search_index = [
+                (symbol.name.upper(), symbol.description.upper(), symbol)
+                for symbol in all_symbols
+            ]
+            self._search_index_source = all_symbols
+
         pattern_upper = pattern.upper()
-        
-        return [
-            symbol for symbol in all_symbols
-            if pattern_upper in symbol.name.upper() or pattern_upper in symbol.description.upper()
-        ]
-    
+
+        # Padrões glob (* e ?) viram um regex compilado uma vez via
+        # fnmatch.translate; o comum (substring pura) segue no operador
+        # `in` do CPython, que já faz a busca de substring em C
+        if "*" in pattern or "?" in pattern:
+            glob_match = re.compile(fnmatch.translate(pattern_upper)).match
+            predicate = lambda name, description: (
+                glob_match(name) is not None or glob_match(description) is not None
+            )
+        else:
+            predicate = lambda name, description: (
+                pattern_upper in name or pattern_upper in description
+            )
+
+        matches: List[Symbol] = []
+        for name_upper, description_upper, symbol in self._search_index:
+            if predicate(name_upper, description_upper):
+                matches.append(symbol)
+                if limit is not None and len(matches) >= limit:
+                    break
+
+        return matches
+
     def _map_to_symbol(self, symbol_data: Dict[str, Any]) -> Symbol:
         """Mapear dados da API para entidade Symbol"""
         return Symbol(
@@ -204,8 +613,12 @@ class TickerRepositoryAdapter(ITickerRepository):
     
     def __init__(self, http_client: HttpClient):
         self.http_client = http_client
-        self.logger = logging.getLogger(__name__)
-    
+        self.logger = _logger
+        # Servidores mais antigos não têm /GetTickersBatch/; após o
+        # primeiro 404 o lote vem de /GetTickers/ por símbolo, sem
+        # retentar o endpoint em lote
+        self._server_batch_supported = True
+
     async def get_tickers_by_period(
         self, 
         symbol: str, 
@@ -227,15 +640,200 @@ class TickerRepositoryAdapter(ITickerRepository):
             
             tickers_data = response.get("Resposta", {}).get("tickers", [])
             
-            return [self._map_to_ticker(ticker_data, symbol) for ticker_data in tickers_data]
+            # Dados já validados pela API: suprimir o __post_init__ por linha
+            with trusted_construction():
+                return [self._map_to_ticker(ticker_data, symbol) for ticker_data in tickers_data]
             
         except Exception as e:
             self.logger.error(f"Error getting tickers for {symbol}: {e}")
             raise
     
+    async def get_tickers_columns(
+        self,
+        symbol: str,
+        date_from: datetime,
+        date_to: datetime,
+        timeframe: int = 1
+    ) -> TickerBatch:
+        """Obter cotações por período em layout colunar (SoA)"""
+        try:
+            response = await self.http_client.post("/GetTickers/", {
+                "active": symbol,
+                "dateFrom": date_from.strftime("%Y-%m-%d %H:%M:%S"),
+                "dateTo": date_to.strftime("%Y-%m-%d %H:%M:%S"),
+                "timeframe": timeframe
+            })
+
+            if not response.get("OK"):
+                raise Exception(f"API Error: {response.get('Error', 'Unknown error')}")
+
+            tickers_data = response.get("Resposta", {}).get("tickers", [])
+            return self._rows_to_batch(symbol, tickers_data)
+
+        except Exception as e:
+            self.logger.error(f"Error getting ticker columns for {symbol}: {e}")
+            raise
+
+    def _rows_to_batch(self, symbol: str, rows: List[Dict[str, Any]]) -> TickerBatch:
+        """Preencher colunas NumPy direto das linhas da API
+
+        Uma única passada pelas linhas, sem criar objetos Ticker
+        intermediários — para lotes grandes é aqui que o layout SoA ganha.
+        """
+        n = len(rows)
+        time_arr = np.empty(n, dtype="datetime64[s]")
+        open_arr = np.empty(n, dtype=np.float64)
+        high_arr = np.empty(n, dtype=np.float64)
+        low_arr = np.empty(n, dtype=np.float64)
+        close_arr = np.empty(n, dtype=np.float64)
+        volume_arr = np.empty(n, dtype=np.int64)
+
+        for i, row in enumerate(rows):
+            time_str = row.get("time")
+            time_arr[i] = np.datetime64(time_str.replace(" ", "T")) if time_str else np.datetime64("now")
+            open_arr[i] = row.get("open", 0)
+            high_arr[i] = row.get("high", 0)
+            low_arr[i] = row.get("low", 0)
+            close_arr[i] = row.get("close", 0)
+            volume_arr[i] = row.get("volume", 0)
+
+        return TickerBatch(
+            symbol=symbol,
+            time=time_arr,
+            open=open_arr,
+            high=high_arr,
+            low=low_arr,
+            close=close_arr,
+            volume=volume_arr,
+        )
+
+    async def iter_tickers(
+        self,
+        symbol: str,
+        date_from: datetime,
+        date_to: datetime,
+        timeframe: int = 1
+    ) -> AsyncIterator[Ticker]:
+        """Iterar cotações do período conforme chegam da rede
+
+        Para consultas de anos inteiros o corpo pode ter dezenas de MB;
+        aqui cada Ticker é emitido assim que sua linha é parseada, sem
+        materializar a lista completa. Requer ijson (extra "stream").
+        """
+        stream = self.http_client.post_stream("/GetTickers/", {
+            "active": symbol,
+            "dateFrom": date_from.strftime("%Y-%m-%d %H:%M:%S"),
+            "dateTo": date_to.strftime("%Y-%m-%d %H:%M:%S"),
+            "timeframe": timeframe
+        }, item_path="Resposta.tickers.item")
+
+        async for ticker_data in stream:
+            # trusted_construction por item (bloco síncrono): o flag não
+            # pode ficar ativo através de um await/yield
+            with trusted_construction():
+                ticker = self._map_to_ticker(ticker_data, symbol)
+            yield ticker
+
+    async def get_tickers_frame(
+        self,
+        symbol: str,
+        date_from: datetime,
+        date_to: datetime,
+        timeframe: int = 1
+    ) -> "pd.DataFrame":
+        """Obter cotações por período como pandas DataFrame
+
+        Construção colunar em uma chamada (pd.DataFrame sobre as linhas do
+        JSON + pd.to_datetime vetorizado com cache), ordens de grandeza
+        mais barata que materializar milhares de entidades Ticker quando o
+        destino são indicadores/agregações vetorizadas.
+
+        Requer pandas instalado (extra "frame").
+        """
+        if pd is None:
+            raise ImportError(
+                "pandas é necessário para get_tickers_frame "
+                "(pip install mt5-trading-client[frame])"
+            )
+
+        try:
+            response = await self.http_client.post("/GetTickers/", {
+                "active": symbol,
+                "dateFrom": date_from.strftime("%Y-%m-%d %H:%M:%S"),
+                "dateTo": date_to.strftime("%Y-%m-%d %H:%M:%S"),
+                "timeframe": timeframe
+            })
+
+            if not response.get("OK"):
+                raise Exception(f"API Error: {response.get('Error', 'Unknown error')}")
+
+            tickers_data = response.get("Resposta", {}).get("tickers", [])
+
+            df = pd.DataFrame(tickers_data, columns=["time", "open", "high", "low", "close", "volume"])
+            # cache=True deduplica timestamps repetidos antes do parse
+            df["time"] = pd.to_datetime(df["time"], format="%Y-%m-%d %H:%M:%S", cache=True)
+            df[["open", "high", "low", "close"]] = df[["open", "high", "low", "close"]].astype("float64")
+            df["symbol"] = symbol
+            return df
+
+        except Exception as e:
+            self.logger.error(f"Error getting ticker frame for {symbol}: {e}")
+            raise
+
+    async def get_tickers_by_period_batch(
+        self,
+        symbols: List[str],
+        date_from: datetime,
+        date_to: datetime,
+        timeframe: int = 1
+    ) -> Dict[str, List[Ticker]]:
+        """Obter cotações de múltiplos símbolos em uma única requisição
+
+        Servidores antigos caem no fallback por símbolo via /GetTickers/.
+        """
+        if self._server_batch_supported:
+            try:
+                response = await self.http_client.post("/GetTickersBatch/", {
+                    "actives": symbols,
+                    "dateFrom": date_from.strftime("%Y-%m-%d %H:%M:%S"),
+                    "dateTo": date_to.strftime("%Y-%m-%d %H:%M:%S"),
+                    "timeframe": timeframe
+                })
+
+                if not response.get("OK"):
+                    raise Exception(f"API Error: {response.get('Error', 'Unknown error')}")
+
+                symbols_data = response.get("Resposta", {}).get("symbols", {})
+
+                with trusted_construction():
+                    return {
+                        symbol: [self._map_to_ticker(ticker_data, symbol) for ticker_data in tickers_data]
+                        for symbol, tickers_data in symbols_data.items()
+                    }
+
+            except aiohttp.ClientResponseError as e:
+                if e.status in (400, 404):
+                    self.logger.info(
+                        "Server lacks /GetTickersBatch/, falling back to /GetTickers/ per symbol"
+                    )
+                    self._server_batch_supported = False
+                else:
+                    self.logger.error(f"Error getting batch tickers for {symbols}: {e}")
+                    raise
+            except Exception as e:
+                self.logger.error(f"Error getting batch tickers for {symbols}: {e}")
+                raise
+
+        # Fallback: uma chamada /GetTickers/ por símbolo, em paralelo
+        tickers_per_symbol = await asyncio.gather(
+            *(self.get_tickers_by_period(symbol, date_from, date_to, timeframe)
+              for symbol in symbols)
+        )
+        return dict(zip(symbols, tickers_per_symbol))
+
     async def get_latest_tickers(
-        self, 
-        symbol: str, 
+        self,
+        symbol: str,
         count: int = 10,
         timeframe: int = 1
     ) -> List[Ticker]:
@@ -252,7 +850,8 @@ class TickerRepositoryAdapter(ITickerRepository):
             
             tickers_data = response.get("Resposta", {}).get("tickers", [])
             
-            return [self._map_to_ticker(ticker_data, symbol) for ticker_data in tickers_data]
+            with trusted_construction():
+                return [self._map_to_ticker(ticker_data, symbol) for ticker_data in tickers_data]
             
         except Exception as e:
             self.logger.error(f"Error getting latest tickers for {symbol}: {e}")
@@ -266,15 +865,18 @@ class TickerRepositoryAdapter(ITickerRepository):
     def _map_to_ticker(self, ticker_data: Dict[str, Any], symbol: str) -> Ticker:
         """Mapear dados da API para entidade Ticker"""
         time_str = ticker_data.get("time", "")
-        time_obj = datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S") if time_str else datetime.now()
+        # fromisoformat é um parser C especializado, ~10x mais rápido que
+        # strptime (que interpreta o format string a cada chamada); desde
+        # o 3.11 aceita o separador de espaço usado pela API
+        time_obj = datetime.fromisoformat(time_str) if time_str else datetime.now()
         
         return Ticker(
             symbol=symbol,
             time=time_obj,
-            open=Decimal(str(ticker_data.get("open", 0))),
-            high=Decimal(str(ticker_data.get("high", 0))),
-            low=Decimal(str(ticker_data.get("low", 0))),
-            close=Decimal(str(ticker_data.get("close", 0))),
+            open=float(ticker_data.get("open", 0)),
+            high=float(ticker_data.get("high", 0)),
+            low=float(ticker_data.get("low", 0)),
+            close=float(ticker_data.get("close", 0)),
             volume=ticker_data.get("volume", 0)
         )
 
@@ -288,8 +890,11 @@ class MarketAnalysisRepositoryAdapter(IMarketAnalysisRepository):
     
     def __init__(self, http_client: HttpClient):
         self.http_client = http_client
-        self.logger = logging.getLogger(__name__)
-    
+        self.logger = _logger
+        # Servidores mais antigos não têm /GetCurrentPrices/; após o
+        # primeiro 404 os preços vêm do fallback, sem retentar o endpoint
+        self._server_prices_supported = True
+
     async def get_symbols_percent_change(
         self, 
         symbols: List[str],
@@ -322,11 +927,77 @@ class MarketAnalysisRepositoryAdapter(IMarketAnalysisRepository):
         results = await self.get_symbols_percent_change([symbol], timeframe)
         return results[0] if results else None
     
+    async def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Obter preços atuais (último fechamento) de múltiplos símbolos
+
+        Preferir o RPC estreito /GetCurrentPrices/: uma requisição e um
+        payload {símbolo: float} em vez de dados de mercado completos por
+        símbolo. Servidores antigos caem no fallback via /GetTickersPos/.
+        """
+        if self._server_prices_supported:
+            try:
+                response = await self.http_client.post("/GetCurrentPrices/", {
+                    "actives": symbols
+                })
+                if response.get("OK"):
+                    prices = response.get("Resposta", {}).get("prices", {})
+                    return {symbol: float(price) for symbol, price in prices.items()}
+            except aiohttp.ClientResponseError as e:
+                if e.status in (400, 404):
+                    self.logger.info(
+                        "Server lacks /GetCurrentPrices/, falling back to /GetTickersPos/"
+                    )
+                    self._server_prices_supported = False
+                else:
+                    raise
+
+        # Fallback: última cotação por símbolo, em paralelo; falha
+        # individual não derruba o lote (o símbolo só fica de fora)
+        async def _last_close(symbol: str) -> Optional[float]:
+            try:
+                response = await self.http_client.post("/GetTickersPos/", {
+                    "active": symbol,
+                    "position": 1,
+                    "timeframe": 1
+                })
+                tickers = response.get("Resposta", {}).get("tickers", [])
+                return float(tickers[-1]["close"]) if tickers else None
+            except Exception:
+                self.logger.warning(f"Error getting current price for {symbol}")
+                return None
+
+        closes = await asyncio.gather(*(_last_close(symbol) for symbol in symbols))
+        return {
+            symbol: close for symbol, close in zip(symbols, closes) if close is not None
+        }
+
+    async def stream_prices(
+        self,
+        symbols: List[str],
+        interval: float = 1.0
+    ) -> AsyncIterator[Dict[str, float]]:
+        """Assinar preços via WebSocket e iterar os mapas recebidos
+
+        Push em vez de polling: uma conexão, um frame por atualização —
+        sem refazer headers HTTP nem pagar RTT por consulta em loops
+        apertados de get_current_prices.
+        """
+        ws_context = await self.http_client.ws_connect("/ws/prices")
+        async with ws_context as ws:
+            await ws.send_json({"subscribe": symbols, "interval": interval})
+
+            async for message in ws:
+                if message.type == aiohttp.WSMsgType.TEXT:
+                    prices = _json_loads(message.data)
+                    yield {symbol: float(price) for symbol, price in prices.items()}
+                elif message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    break
+
     def _map_to_percent_change(self, symbol_data: Dict[str, Any]) -> SymbolPercentChange:
         """Mapear dados da API para entidade SymbolPercentChange"""
         return SymbolPercentChange(
             symbol=symbol_data.get("symbol", ""),
-            pct_change=Decimal(str(symbol_data.get("pct_change", 0))),
+            pct_change=float(symbol_data.get("pct_change", 0)),
             error=symbol_data.get("error")
         )
 
@@ -340,7 +1011,7 @@ class HealthRepositoryAdapter(IHealthRepository):
     
     def __init__(self, http_client: HttpClient):
         self.http_client = http_client
-        self.logger = logging.getLogger(__name__)
+        self.logger = _logger
     
     async def check_health(self) -> ApiResponse:
         """Verificar saúde da API"""
@@ -394,8 +1065,16 @@ class MarketDataRepositoryAdapter(IMarketDataRepository):
         self.symbol_repo = symbol_repo
         self.ticker_repo = ticker_repo
         self.analysis_repo = analysis_repo
-        self.logger = logging.getLogger(__name__)
+        self.logger = _logger
     
+    @staticmethod
+    async def _safe(task: "asyncio.Task"):
+        """Aguardar uma task tratando falha como dado ausente (None)"""
+        try:
+            return await task
+        except Exception:
+            return None
+
     async def get_complete_market_data(self, symbol_name: str) -> Optional[MarketData]:
         """Obter dados completos de mercado"""
         try:
@@ -403,24 +1082,18 @@ class MarketDataRepositoryAdapter(IMarketDataRepository):
             symbol = await self.symbol_repo.get_symbol_by_name(symbol_name)
             if not symbol:
                 return None
-            
-            # Obter dados em paralelo
-            tasks = [
-                self.ticker_repo.get_latest_ticker(symbol_name),
-                self.ticker_repo.get_latest_tickers(symbol_name, 10),
-                self.analysis_repo.get_symbol_percent_change(symbol_name)
-            ]
-            
-            latest_ticker, tickers, percent_change = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Tratar exceções
-            if isinstance(latest_ticker, Exception):
-                latest_ticker = None
-            if isinstance(tickers, Exception):
-                tickers = None
-            if isinstance(percent_change, Exception):
-                percent_change = None
-            
+
+            # Disparar as três consultas de uma vez; cada uma é aguardada
+            # individualmente via _safe, sem o re-empacotamento de exceções
+            # em valores (return_exceptions) nem a passada de isinstance
+            ticker_task = asyncio.create_task(self.ticker_repo.get_latest_ticker(symbol_name))
+            tickers_task = asyncio.create_task(self.ticker_repo.get_latest_tickers(symbol_name, 10))
+            pct_task = asyncio.create_task(self.analysis_repo.get_symbol_percent_change(symbol_name))
+
+            latest_ticker = await self._safe(ticker_task)
+            tickers = await self._safe(tickers_task)
+            percent_change = await self._safe(pct_task)
+
             return MarketData(
                 symbol=symbol,
                 latest_ticker=latest_ticker,
@@ -432,10 +1105,54 @@ class MarketDataRepositoryAdapter(IMarketDataRepository):
             self.logger.error(f"Error getting market data for {symbol_name}: {e}")
             raise
     
-    async def get_multiple_market_data(self, symbol_names: List[str]) -> List[MarketData]:
-        """Obter dados de múltiplos símbolos"""
-        tasks = [self.get_complete_market_data(symbol) for symbol in symbol_names]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filtrar apenas resultados válidos
-        return [result for result in results if isinstance(result, MarketData)]
\ No newline at end of file
+    async def get_multiple_market_data(
+        self,
+        symbol_names: List[str],
+        concurrency: int = 10
+    ) -> List[MarketData]:
+        """Obter dados de múltiplos símbolos
+
+        Args:
+            symbol_names: Símbolos a consultar
+            concurrency: Máximo de símbolos em voo simultaneamente
+        """
+        return [data async for data in self.iter_market_data(symbol_names, concurrency)]
+
+    async def iter_market_data(
+        self,
+        symbol_names: List[str],
+        concurrency: int = 10
+    ) -> AsyncIterator[MarketData]:
+        """Iterar dados de mercado na ordem em que ficam prontos
+
+        as_completed emite cada resultado assim que a resposta chega, em
+        vez de segurar tudo até o gather do lote inteiro: o consumidor
+        converte/processa um símbolo enquanto os demais ainda estão na
+        rede, fundindo CPU com espera de I/O. A ordem de saída é a de
+        conclusão, não a da lista de entrada.
+        """
+        # Fan-out concorrente, mas limitado: cada símbolo dispara 3-4
+        # requisições internas, então um semáforo evita sobrecarregar o
+        # servidor quando a lista de símbolos é grande
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded(symbol: str) -> Optional[MarketData]:
+            async with semaphore:
+                try:
+                    return await self.get_complete_market_data(symbol)
+                except Exception:
+                    # Falha individual não aborta o lote; o símbolo só
+                    # fica de fora do resultado
+                    self.logger.warning(f"Error getting market data for {symbol}")
+                    return None
+
+        tasks = [asyncio.create_task(_bounded(symbol)) for symbol in symbol_names]
+        try:
+            for future in asyncio.as_completed(tasks):
+                data = await future
+                if data is not None:
+                    yield data
+        finally:
+            # Consumidor abandonou o generator: não deixar tasks órfãs
+            for task in tasks:
+                task.cancel()
\ No newline at end of file
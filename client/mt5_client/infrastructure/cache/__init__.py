@@ -0,0 +1,103 @@
+"""
+MT5 Client - Infrastructure Cache
+Backends de cache plugáveis para dados de referência
+
+O catálogo de símbolos muda no máximo algumas vezes por hora; re-baixá-lo
+a cada consulta é o maior custo evitável dos fluxos de leitura. Ambos os
+backends expõem a mesma interface assíncrona:
+
+    await cache.get(key, type_=...)  ->  valor ou None
+    await cache.set(key, valor, ttl)
+
+O type_ permite ao RedisCache reidratar DTOs msgspec no tipo original;
+o backend em memória o ignora (guarda os objetos direto).
+"""
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import msgspec
+
+# redis é opcional (extra "cache"): só é necessário para compartilhar o
+# cache entre processos/máquinas
+try:
+    from redis import asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+
+class InMemoryTTLCache:
+    """
+    Cache TTL no próprio processo
+
+    Single Responsibility: Apenas memoização local com expiração
+    Hit servido em microssegundos, sem rede; ideal para um único processo.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._maxsize = maxsize
+        self._data: Dict[str, Tuple[float, Any]] = {}
+
+    async def get(self, key: str, type_: Any = None) -> Optional[Any]:
+        """Obter valor se presente e não expirado"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return None
+
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """Guardar valor com expiração"""
+        if len(self._data) >= self._maxsize:
+            # Descarte barato: primeiro os expirados; se nada expirou,
+            # a entrada mais antiga (ordem de inserção do dict)
+            now = time.monotonic()
+            for stale in [k for k, (exp, _) in self._data.items() if exp < now]:
+                del self._data[stale]
+            if len(self._data) >= self._maxsize:
+                self._data.pop(next(iter(self._data)))
+
+        self._data[key] = (time.monotonic() + ttl, value)
+
+
+class RedisCache:
+    """
+    Cache compartilhado via Redis
+
+    Single Responsibility: Apenas cache distribuído com expiração
+    Valores são serializados com msgspec/MessagePack, então DTOs msgspec
+    sobrevivem ao round-trip quando o type_ é informado no get.
+
+    Requer redis instalado (extra "cache").
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0"):
+        if aioredis is None:
+            raise ImportError(
+                "redis é necessário para o RedisCache "
+                "(pip install mt5-trading-client[cache])"
+            )
+        self._redis = aioredis.Redis.from_url(url)
+        self._encoder = msgspec.msgpack.Encoder()
+
+    async def get(self, key: str, type_: Any = None) -> Optional[Any]:
+        """Obter e reidratar valor se presente"""
+        data = await self._redis.get(key)
+        if data is None:
+            return None
+
+        if type_ is not None:
+            return msgspec.msgpack.decode(data, type=type_)
+        return msgspec.msgpack.decode(data)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """Serializar e guardar valor com expiração"""
+        await self._redis.set(key, self._encoder.encode(value), ex=max(1, int(ttl)))
+
+    async def close(self) -> None:
+        """Fechar a conexão com o Redis"""
+        await self._redis.aclose()
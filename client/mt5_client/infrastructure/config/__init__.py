@@ -2,25 +2,60 @@
 MT5 Client - Infrastructure Configuration
 Configurações da infraestrutura
 """
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional
 import os
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApiConfig:
     """
     Configuração da API MT5
-    
+
     Single Responsibility: Apenas configuração
+
+    frozen+slots: leituras de atributo no caminho quente de cada
+    requisição viram acesso C a slot (sem lookup em __dict__), e a
+    configuração fica imutável após a construção.
     """
     base_url: str = "http://localhost:8000"
     api_key: Optional[str] = None
     timeout: int = 30
     max_retries: int = 3
     retry_delay: float = 1.0
+    retry_cap: float = 30.0
     verify_ssl: bool = True
-    
+    max_connections: int = 100
+    max_connections_per_host: int = 50
+    keepalive_timeout: float = 75.0
+    # "aiohttp" (padrão) ou "httpx" (HTTP/2 multiplexado; extra "http2")
+    http_backend: str = "aiohttp"
+    _base_url_clean: str = field(init=False, repr=False, default="")
+    _headers: Mapping[str, str] = field(init=False, repr=False, default=None)
+
+    def __post_init__(self):
+        # base_url normalizada uma vez: quem monta URLs no caminho quente
+        # concatena direto, sem repetir rstrip() a cada requisição.
+        # object.__setattr__ contorna o guard do frozen durante o init
+        object.__setattr__(self, '_base_url_clean', self.base_url.rstrip('/'))
+
+        # Headers montados uma vez e congelados (MappingProxyType).
+        # Accept-Encoding: gzip reduz 5-10x os bytes de payloads JSON de
+        # tickers no fio (o aiohttp descomprime sozinho). Import tardio da
+        # versão para não criar ciclo durante o import do pacote
+        from ... import __version__
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/msgpack, application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+            "User-Agent": f"mt5-client/{__version__}"
+        }
+        if self.api_key:
+            headers["AcessKey"] = self.api_key
+        object.__setattr__(self, '_headers', MappingProxyType(headers))
+
     @classmethod
     def from_environment(cls) -> 'ApiConfig':
         """Criar configuração a partir de variáveis de ambiente"""
@@ -30,23 +65,24 @@ class ApiConfig:
             timeout=int(os.getenv("MT5_API_TIMEOUT", "30")),
             max_retries=int(os.getenv("MT5_API_MAX_RETRIES", "3")),
             retry_delay=float(os.getenv("MT5_API_RETRY_DELAY", "1.0")),
-            verify_ssl=os.getenv("MT5_API_VERIFY_SSL", "true").lower() == "true"
+            retry_cap=float(os.getenv("MT5_API_RETRY_CAP", "30.0")),
+            verify_ssl=os.getenv("MT5_API_VERIFY_SSL", "true").lower() == "true",
+            max_connections=int(os.getenv("MT5_API_MAX_CONNECTIONS", "100")),
+            max_connections_per_host=int(os.getenv("MT5_API_MAX_CONNECTIONS_PER_HOST", "50")),
+            keepalive_timeout=float(os.getenv("MT5_API_KEEPALIVE_TIMEOUT", "75.0")),
+            http_backend=os.getenv("MT5_API_HTTP_BACKEND", "aiohttp")
         )
     
-    def get_headers(self) -> dict:
-        """Obter headers para requisições"""
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
-        
-        if self.api_key:
-            headers["AcessKey"] = self.api_key
-        
-        return headers
+    def get_headers(self) -> Mapping[str, str]:
+        """Obter headers para requisições (pré-computados na construção)
+
+        Preferir MessagePack na negociação: decodificação bem mais
+        barata e payloads menores; o servidor cai para JSON se não suportar
+        """
+        return self._headers
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     """
     Configuração de logging
@@ -63,7 +99,10 @@ class LoggingConfig:
         """Criar configuração a partir de variáveis de ambiente"""
         return cls(
             level=os.getenv("MT5_CLIENT_LOG_LEVEL", "INFO"),
-            format=os.getenv("MT5_CLIENT_LOG_FORMAT", cls.format),
+            format=os.getenv(
+                "MT5_CLIENT_LOG_FORMAT",
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            ),
             enable_file_logging=os.getenv("MT5_CLIENT_ENABLE_FILE_LOG", "false").lower() == "true",
             log_file_path=os.getenv("MT5_CLIENT_LOG_FILE_PATH")
         )
\ No newline at end of file
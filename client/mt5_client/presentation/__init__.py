@@ -4,25 +4,84 @@ Cliente Python para consumir MT5 Trading API de outras máquinas
 """
 import asyncio
 import logging
-from typing import List, Optional, Dict, Any
+import time
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
+# uvloop é opcional (extra "perf", só em POSIX): loop de eventos em libuv,
+# 2-4x mais rápido que o loop padrão em cargas aiohttp/httpx. Usuários
+# async devem instalar a policy no startup da aplicação:
+#     import uvloop; asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+# O SimpleMT5Client usa o uvloop automaticamente quando disponível.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# ijson é opcional (extra "stream"): com ele instalado, iter_tickers faz
+# parse incremental da resposta HTTP em vez de bufferizar o período todo
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from ..infrastructure import MT5Repository
+from ..infrastructure.cache import InMemoryTTLCache, RedisCache  # noqa: F401 (re-export)
 from ..infrastructure.config import ApiConfig, LoggingConfig
 from ..application import (
     GetSymbolsUseCase, GetSymbolInfoUseCase, SearchSymbolsUseCase,
-    GetTickersUseCase, GetTickersPosUseCase, GetSymbolsPctChangeUseCase,
-    GetMarketDataUseCase, GetMultipleMarketDataUseCase, CheckApiHealthUseCase,
-    MarketAnalysisUseCase
+    GetTickersUseCase, IterTickersUseCase, GetTickersBatchUseCase, GetTickersPosUseCase,
+    GetTickersArrayUseCase, GetSymbolsPctChangeUseCase, GetCurrentPricesUseCase,
+    StreamPricesUseCase, GetMarketDataUseCase, GetMultipleMarketDataUseCase,
+    CheckApiHealthUseCase, MarketAnalysisUseCase
 )
 from ..application.dtos import (
     GetSymbolsRequest, GetSymbolInfoRequest, SearchSymbolsRequest,
-    GetTickersRequest, GetTickersPosRequest, GetSymbolsPctChangeRequest,
-    GetMarketDataRequest, SymbolResponse, TickerResponse,
-    SymbolPctChangeResponse, MarketDataResponse, ApiHealthResponse
+    GetTickersRequest, GetTickersBatchRequest, GetTickersPosRequest,
+    GetSymbolsPctChangeRequest, GetMarketDataRequest, SymbolResponse,
+    TickerResponse, TickerArrayResponse, SymbolPctChangeResponse,
+    MarketDataResponse, ApiHealthResponse
 )
 
 
+# Cache de símbolos compartilhado entre clientes, chaveado pela URL da API:
+# {base_url: (expira_em, lista_de_símbolos, índice_por_nome)}
+_SYMBOLS_CACHE_TTL = 300.0  # 5 minutos
+_symbols_cache: Dict[str, Tuple[float, List[SymbolResponse], Dict[str, SymbolResponse]]] = {}
+_symbols_cache_lock = asyncio.Lock()
+
+# Principais pares Forex: frozenset para membership O(1) nos filtros
+_MAJOR_PAIRS = frozenset((
+    "EURUSD", "USDJPY", "GBPUSD", "AUDUSD", "USDCHF", "NZDUSD", "USDCAD"
+))
+
+# Cache de health checks por URL: {base_url: (expira_em, resposta)}
+_HEALTH_CACHE_TTL = 30.0  # segundos
+_health_cache: Dict[str, Tuple[float, ApiHealthResponse]] = {}
+_health_cache_lock = asyncio.Lock()
+
+
+# Request sem campos é imutável na prática: uma instância única evita
+# alocar um DTO novo a cada get_symbols
+_EMPTY_GET_SYMBOLS_REQUEST = GetSymbolsRequest()
+
+
+def configure_logging(level: str = "INFO") -> None:
+    """
+    Configurar o logging global da biblioteca (chamar uma vez no startup)
+
+    Substitui o logging.basicConfig que antes rodava em cada construção
+    de cliente: configuração global é decisão da aplicação, e repeti-la
+    por instância só pagava o lock do logging sem efeito após a primeira
+    chamada.
+
+    Args:
+        level: Nível de logging (DEBUG, INFO, WARNING, ERROR)
+    """
+    logging_config = LoggingConfig(level=level)
+    logging.basicConfig(level=logging_config.level, format=logging_config.format)
+
+
 class MT5TradingClient:
     """
     Cliente principal para MT5 Trading API
@@ -49,46 +108,67 @@ class MT5TradingClient:
     """
     
     def __init__(
-        self, 
+        self,
         api_url: str = "http://localhost:8000",
         api_key: Optional[str] = None,
         timeout: int = 30,
         max_retries: int = 3,
-        log_level: str = "INFO"
+        log_level: str = "INFO",
+        max_connections: int = 100,
+        max_connections_per_host: int = 50,
+        max_concurrency: int = 16,
+        cache_backend: Optional[Any] = None
     ):
         """
         Inicializar cliente MT5
-        
+
         Args:
             api_url: URL base da API MT5
-            api_key: Chave de API para autenticação  
+            api_key: Chave de API para autenticação
             timeout: Timeout para requisições (segundos)
             max_retries: Número máximo de tentativas
             log_level: Nível de logging (DEBUG, INFO, WARNING, ERROR)
+            max_connections: Tamanho total do pool de conexões HTTP
+            max_connections_per_host: Limite de conexões simultâneas por host
+            max_concurrency: Máximo de símbolos consultados em paralelo nos
+                fan-outs (get_multiple_market_data, get_market_data_many)
+            cache_backend: Backend opcional com get(key, type_)/set(key,
+                value, ttl) assíncronos (InMemoryTTLCache, RedisCache) usado
+                como segundo nível para símbolos; compartilha o catálogo
+                entre processos quando Redis é usado
         """
-        # Configurar logging
-        logging_config = LoggingConfig(level=log_level)
-        logging.basicConfig(level=logging_config.level, format=logging_config.format)
-        
+        # Logger do módulo com o nível pedido; a configuração global de
+        # handlers/formato fica a cargo de mt5_client.configure_logging
+        # (construir N clientes não toca mais o lock global do logging)
         self.logger = logging.getLogger(__name__)
+        self.logger.setLevel(log_level)
         
         # Configurar API
         self.config = ApiConfig(
             base_url=api_url,
             api_key=api_key,
             timeout=timeout,
-            max_retries=max_retries
+            max_retries=max_retries,
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host
         )
         
-        # Repositório e use cases
+        # Repositório e use cases (atributos planos, ligados em _initialize)
         self._repository: Optional[MT5Repository] = None
-        self._use_cases: Dict[str, Any] = {}
+        # Flag de inicialização one-shot: os métodos públicos só pagam um
+        # teste de atributo por chamada; o lock serializa a primeira
+        # inicialização entre tasks concorrentes
+        self._initialized = False
+        self._init_lock = asyncio.Lock()
+        self._max_concurrency = max_concurrency
+        self._cache_backend = cache_backend
         
         self.logger.info(f"MT5 Client initialized for {api_url}")
     
     async def __aenter__(self):
         """Async context manager entry"""
-        await self._initialize()
+        if not self._initialized:
+            await self._initialize()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -96,34 +176,48 @@ class MT5TradingClient:
         await self.close()
     
     async def _initialize(self):
-        """Inicializar repositório e use cases"""
-        if self._repository is None:
+        """Inicializar repositório e use cases (idempotente, thread-safe)"""
+        if self._initialized:
+            return
+
+        async with self._init_lock:
+            # Outra task pode ter inicializado enquanto esperávamos o lock
+            if self._initialized:
+                return
+
             self._repository = MT5Repository(self.config)
             await self._repository.__aenter__()
-            
-            # Inicializar use cases
-            self._use_cases = {
-                'get_symbols': GetSymbolsUseCase(self._repository),
-                'get_symbol_info': GetSymbolInfoUseCase(self._repository),
-                'search_symbols': SearchSymbolsUseCase(self._repository),
-                'get_tickers': GetTickersUseCase(self._repository),
-                'get_tickers_pos': GetTickersPosUseCase(self._repository),
-                'get_symbols_pct_change': GetSymbolsPctChangeUseCase(self._repository),
-                'get_market_data': GetMarketDataUseCase(self._repository),
-                'get_multiple_market_data': GetMultipleMarketDataUseCase(self._repository),
-                'check_health': CheckApiHealthUseCase(self._repository),
-                'market_analysis': MarketAnalysisUseCase(self._repository)
-            }
-            
+
+            # Ligar use cases como atributos planos: o despacho nos métodos
+            # públicos vira um lookup de atributo em vez de hash de string
+            # no dict a cada chamada
+            self._uc_get_symbols = GetSymbolsUseCase(self._repository)
+            self._uc_get_symbol_info = GetSymbolInfoUseCase(self._repository)
+            self._uc_search_symbols = SearchSymbolsUseCase(self._repository)
+            self._uc_get_tickers = GetTickersUseCase(self._repository)
+            self._uc_iter_tickers = IterTickersUseCase(self._repository)
+            self._uc_get_tickers_array = GetTickersArrayUseCase(self._repository)
+            self._uc_get_tickers_batch = GetTickersBatchUseCase(self._repository)
+            self._uc_get_tickers_pos = GetTickersPosUseCase(self._repository)
+            self._uc_get_symbols_pct_change = GetSymbolsPctChangeUseCase(self._repository)
+            self._uc_get_current_prices = GetCurrentPricesUseCase(self._repository)
+            self._uc_stream_prices = StreamPricesUseCase(self._repository)
+            self._uc_get_market_data = GetMarketDataUseCase(self._repository)
+            self._uc_get_multiple_market_data = GetMultipleMarketDataUseCase(self._repository)
+            self._uc_check_health = CheckApiHealthUseCase(self._repository)
+            self._uc_market_analysis = MarketAnalysisUseCase(self._repository)
+
+            # Publicar o flag por último: quem vir True encontra tudo pronto
+            self._initialized = True
             self.logger.info("MT5 Client initialized successfully")
     
     async def close(self):
         """Fechar recursos do cliente"""
+        self._initialized = False
         if self._repository:
             await self._repository.close()
             self._repository = None
         
-        self._use_cases.clear()
         self.logger.info("MT5 Client closed")
     
     # Métodos públicos da API
@@ -131,23 +225,91 @@ class MT5TradingClient:
     async def check_health(self) -> ApiHealthResponse:
         """
         Verificar saúde da API MT5
-        
+
+        O resultado é memoizado por 30 segundos por URL da API, evitando
+        probes redundantes quando vários exemplos rodam no mesmo
+        processo. Expirado o TTL, a próxima chamada consulta a API de
+        novo — e propaga o erro se ela estiver fora, como antes do cache.
+
         Returns:
             Status de saúde da API e conexão MT5
         """
-        await self._initialize()
-        return await self._use_cases['check_health'].execute()
+        if not self._initialized:
+            await self._initialize()
+
+        entrada = _health_cache.get(self.config.base_url)
+        if entrada and entrada[0] > time.monotonic():
+            return entrada[1]
+
+        return await self._refresh_health()
+
+    async def _refresh_health(self) -> ApiHealthResponse:
+        """Atualizar o cache de health check (serializado por lock)"""
+        async with _health_cache_lock:
+            agora = time.monotonic()
+            entrada = _health_cache.get(self.config.base_url)
+            if entrada and entrada[0] > agora:
+                return entrada[1]
+
+            health = await self._uc_check_health.execute()
+            _health_cache[self.config.base_url] = (time.monotonic() + _HEALTH_CACHE_TTL, health)
+            return health
     
     async def get_symbols(self) -> List[SymbolResponse]:
         """
         Obter todos os símbolos disponíveis
-        
+
+        A lista completa é cacheada por URL da API com TTL de 5 minutos,
+        evitando re-baixar o catálogo inteiro a cada chamada.
+
         Returns:
             Lista de símbolos com informações detalhadas
         """
-        await self._initialize()
-        request = GetSymbolsRequest()
-        return await self._use_cases['get_symbols'].execute(request)
+        if not self._initialized:
+            await self._initialize()
+
+        agora = time.monotonic()
+        entrada = _symbols_cache.get(self.config.base_url)
+        if entrada and entrada[0] > agora:
+            return entrada[1]
+
+        async with _symbols_cache_lock:
+            # Re-verificar após adquirir o lock (outra task pode ter atualizado)
+            entrada = _symbols_cache.get(self.config.base_url)
+            if entrada and entrada[0] > agora:
+                return entrada[1]
+
+            # Segundo nível opcional (ex: Redis compartilhado entre
+            # processos): hit aqui repovoa o cache local sem ir à rede
+            symbols = None
+            if self._cache_backend is not None:
+                symbols = await self._cache_backend.get(
+                    f"mt5:symbols:{self.config.base_url}", List[SymbolResponse]
+                )
+
+            if symbols is None:
+                symbols = await self._uc_get_symbols.execute(_EMPTY_GET_SYMBOLS_REQUEST)
+                if self._cache_backend is not None:
+                    await self._cache_backend.set(
+                        f"mt5:symbols:{self.config.base_url}", symbols, _SYMBOLS_CACHE_TTL
+                    )
+
+            indice = {symbol.name: symbol for symbol in symbols}
+            _symbols_cache[self.config.base_url] = (agora + _SYMBOLS_CACHE_TTL, symbols, indice)
+            return symbols
+
+    async def get_symbol_index(self) -> Dict[str, SymbolResponse]:
+        """
+        Obter índice {nome: símbolo} pré-construído dos símbolos disponíveis
+
+        Usa o mesmo cache de get_symbols; consultas de disponibilidade
+        passam a ser O(1) em vez de varrer a lista completa.
+
+        Returns:
+            Dicionário {nome do símbolo: SymbolResponse}
+        """
+        await self.get_symbols()
+        return _symbols_cache[self.config.base_url][2]
     
     async def get_symbol_info(self, symbol: str) -> Optional[SymbolResponse]:
         """
@@ -159,9 +321,25 @@ class MT5TradingClient:
         Returns:
             Informações do símbolo ou None se não encontrado
         """
-        await self._initialize()
-        request = GetSymbolInfoRequest(symbol=symbol)
-        return await self._use_cases['get_symbol_info'].execute(request)
+        if not self._initialized:
+            await self._initialize()
+
+        if self._cache_backend is not None:
+            cached = await self._cache_backend.get(
+                f"mt5:symbol:{self.config.base_url}:{symbol}", SymbolResponse
+            )
+            if cached is not None:
+                return cached
+
+        request = GetSymbolInfoRequest(symbol)
+        response = await self._uc_get_symbol_info.execute(request)
+
+        if response is not None and self._cache_backend is not None:
+            await self._cache_backend.set(
+                f"mt5:symbol:{self.config.base_url}:{symbol}", response, _SYMBOLS_CACHE_TTL
+            )
+
+        return response
     
     async def search_symbols(self, pattern: str, limit: Optional[int] = None) -> List[SymbolResponse]:
         """
@@ -174,9 +352,10 @@ class MT5TradingClient:
         Returns:
             Lista de símbolos que correspondem ao padrão
         """
-        await self._initialize()
-        request = SearchSymbolsRequest(pattern=pattern, limit=limit)
-        return await self._use_cases['search_symbols'].execute(request)
+        if not self._initialized:
+            await self._initialize()
+        request = SearchSymbolsRequest(pattern, limit)
+        return await self._uc_search_symbols.execute(request)
     
     async def get_tickers(
         self,
@@ -197,14 +376,113 @@ class MT5TradingClient:
         Returns:
             Lista de cotações OHLCV
         """
-        await self._initialize()
-        request = GetTickersRequest(
+        # Implementado via requisição em lote para manter um único caminho HTTP
+        tickers_by_symbol = await self.get_tickers_batch(
+            symbols=[symbol],
+            date_from=date_from,
+            date_to=date_to,
+            timeframe=timeframe
+        )
+        return tickers_by_symbol.get(symbol, [])
+
+    async def get_tickers_array(
+        self,
+        symbol: str,
+        date_from: datetime,
+        date_to: datetime,
+        timeframe: int = 1
+    ) -> TickerArrayResponse:
+        """
+        Obter cotações por período em layout colunar (Struct-of-Arrays)
+
+        Variante de get_tickers para lotes grandes e fluxos analíticos:
+        em vez de List[TickerResponse], devolve colunas NumPy contíguas
+        (time/open/high/low/close/volume) prontas para operações
+        vetorizadas. A visão por linha continua disponível sob demanda
+        via .to_records().
+
+        Args:
+            symbol: Nome do símbolo
+            date_from: Data inicial
+            date_to: Data final
+            timeframe: Timeframe (1=M1, 5=M5, 15=M15, 30=M30, 16385=H1, 16388=H4, 16408=D1)
+
+        Returns:
+            Colunas OHLCV como arrays NumPy
+        """
+        if not self._initialized:
+            await self._initialize()
+        request = GetTickersRequest(symbol, date_from, date_to, timeframe)
+        return await self._uc_get_tickers_array.execute(request)
+
+    async def iter_tickers(
+        self,
+        symbol: str,
+        date_from: datetime,
+        date_to: datetime,
+        timeframe: int = 1
+    ) -> AsyncIterator[TickerResponse]:
+        """
+        Iterar cotações de um período, uma a uma
+
+        Com ijson instalado (extra "stream"), cada cotação é emitida
+        assim que sua linha chega da rede, sem materializar a resposta
+        do período inteiro — é o caminho para consultas de anos. Sem
+        ijson, a iteração funciona igual, mas sobre o resultado
+        bufferizado de get_tickers.
+
+        Args:
+            symbol: Nome do símbolo
+            date_from: Data inicial
+            date_to: Data final
+            timeframe: Timeframe (1=M1, 5=M5, 15=M15, 30=M30, 16385=H1, 16388=H4, 16408=D1)
+
+        Yields:
+            Cotações OHLCV individuais
+        """
+        if not self._initialized:
+            await self._initialize()
+
+        if ijson is not None:
+            request = GetTickersRequest(symbol, date_from, date_to, timeframe)
+            async for ticker in self._uc_iter_tickers.execute(request):
+                yield ticker
+            return
+
+        tickers = await self.get_tickers(
             symbol=symbol,
             date_from=date_from,
             date_to=date_to,
             timeframe=timeframe
         )
-        return await self._use_cases['get_tickers'].execute(request)
+        for ticker in tickers:
+            yield ticker
+
+    async def get_tickers_batch(
+        self,
+        symbols: List[str],
+        date_from: datetime,
+        date_to: datetime,
+        timeframe: int = 1
+    ) -> Dict[str, List[TickerResponse]]:
+        """
+        Obter cotações de múltiplos símbolos em uma única requisição
+
+        Substitui N chamadas a get_tickers por uma só ida à API.
+
+        Args:
+            symbols: Lista de símbolos
+            date_from: Data inicial
+            date_to: Data final
+            timeframe: Timeframe (1=M1, 5=M5, 15=M15, 30=M30, 16385=H1, 16388=H4, 16408=D1)
+
+        Returns:
+            Dicionário {símbolo: lista de cotações OHLCV}
+        """
+        if not self._initialized:
+            await self._initialize()
+        request = GetTickersBatchRequest(symbols, date_from, date_to, timeframe)
+        return await self._uc_get_tickers_batch.execute(request)
     
     async def get_latest_tickers(
         self,
@@ -223,13 +501,10 @@ class MT5TradingClient:
         Returns:
             Lista das últimas cotações
         """
-        await self._initialize()
-        request = GetTickersPosRequest(
-            symbol=symbol,
-            count=count,
-            timeframe=timeframe
-        )
-        return await self._use_cases['get_tickers_pos'].execute(request)
+        if not self._initialized:
+            await self._initialize()
+        request = GetTickersPosRequest(symbol, count, timeframe)
+        return await self._uc_get_tickers_pos.execute(request)
     
     async def get_symbols_percent_change(
         self,
@@ -246,9 +521,10 @@ class MT5TradingClient:
         Returns:
             Lista de variações percentuais
         """
-        await self._initialize()
-        request = GetSymbolsPctChangeRequest(symbols=symbols, timeframe=timeframe)
-        return await self._use_cases['get_symbols_pct_change'].execute(request)
+        if not self._initialized:
+            await self._initialize()
+        request = GetSymbolsPctChangeRequest(symbols, timeframe)
+        return await self._uc_get_symbols_pct_change.execute(request)
     
     async def get_market_data(self, symbol: str) -> Optional[MarketDataResponse]:
         """
@@ -260,10 +536,41 @@ class MT5TradingClient:
         Returns:
             Dados completos incluindo símbolo, cotações e variação percentual
         """
-        await self._initialize()
-        request = GetMarketDataRequest(symbol=symbol)
-        return await self._use_cases['get_market_data'].execute(request)
+        if not self._initialized:
+            await self._initialize()
+        request = GetMarketDataRequest(symbol)
+        return await self._uc_get_market_data.execute(request)
     
+    async def get_market_data_many(self, symbols: List[str]) -> Dict[str, Optional[MarketDataResponse]]:
+        """
+        Obter dados de mercado de vários símbolos em paralelo
+
+        Dispara todas as requisições de uma vez com asyncio.gather em vez
+        de N chamadas sequenciais a get_market_data.
+
+        Args:
+            symbols: Lista de símbolos
+
+        Returns:
+            Dicionário {símbolo: dados de mercado ou None se não encontrado}
+        """
+        # Limitar símbolos em voo: cada get_market_data dispara várias
+        # requisições internas, e um gather irrestrito sobre listas
+        # grandes estoura o pool e o servidor de uma vez
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _bounded(symbol: str) -> Optional[MarketDataResponse]:
+            async with semaphore:
+                try:
+                    return await self.get_market_data(symbol)
+                except Exception:
+                    # Falha individual não aborta o lote inteiro
+                    self.logger.warning(f"Failed to get market data for {symbol}")
+                    return None
+
+        results = await asyncio.gather(*(_bounded(symbol) for symbol in symbols))
+        return dict(zip(symbols, results))
+
     async def get_multiple_market_data(self, symbols: List[str]) -> List[MarketDataResponse]:
         """
         Obter dados de mercado para múltiplos símbolos
@@ -274,8 +581,11 @@ class MT5TradingClient:
         Returns:
             Lista de dados de mercado
         """
-        await self._initialize()
-        return await self._use_cases['get_multiple_market_data'].execute(symbols)
+        if not self._initialized:
+            await self._initialize()
+        return await self._uc_get_multiple_market_data.execute(
+            symbols, concurrency=self._max_concurrency
+        )
     
     async def analyze_market(self, symbols: List[str], timeframe: int = 1) -> Dict[str, Any]:
         """
@@ -288,41 +598,71 @@ class MT5TradingClient:
         Returns:
             Análise completa com dados, estatísticas e sentimento
         """
-        await self._initialize()
-        return await self._use_cases['market_analysis'].analyze_symbols(symbols, timeframe)
+        if not self._initialized:
+            await self._initialize()
+        return await self._uc_market_analysis.analyze_symbols(symbols, timeframe)
     
     # Métodos de conveniência
     
     async def get_forex_pairs(self) -> List[SymbolResponse]:
         """Obter apenas pares de moedas Forex"""
         symbols = await self.get_symbols()
-        return [symbol for symbol in symbols if len(symbol.name) == 6 and symbol.name.isalpha()]
-    
+        # name é lido uma vez por símbolo (walrus) e isascii() descarta
+        # barato os nomes não-latinos antes do isalpha(), mais caro
+        return [
+            symbol for symbol in symbols
+            if len(name := symbol.name) == 6 and name.isascii() and name.isalpha()
+        ]
+
     async def get_major_pairs(self) -> List[SymbolResponse]:
         """Obter principais pares de moedas"""
-        major_pairs = ["EURUSD", "USDJPY", "GBPUSD", "AUDUSD", "USDCHF", "NZDUSD", "USDCAD"]
         symbols = await self.get_symbols()
-        return [symbol for symbol in symbols if symbol.name in major_pairs]
+        return [symbol for symbol in symbols if symbol.name in _MAJOR_PAIRS]
     
     async def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
         """
         Obter preços atuais de múltiplos símbolos
-        
+
+        Usa o RPC estreito /GetCurrentPrices/ quando o servidor o expõe:
+        só {símbolo: preço} trafega, em vez de montar (e descartar) os
+        dados de mercado completos de cada símbolo.
+
         Args:
             symbols: Lista de símbolos
-            
+
         Returns:
             Dicionário {símbolo: preço_atual}
         """
-        market_data_list = await self.get_multiple_market_data(symbols)
-        
-        prices = {}
-        for market_data in market_data_list:
-            if market_data.current_price:
-                prices[market_data.symbol.name] = market_data.current_price
-        
-        return prices
+        if not self._initialized:
+            await self._initialize()
+        return await self._uc_get_current_prices.execute(symbols)
     
+    async def stream_prices(
+        self,
+        symbols: List[str],
+        interval: float = 1.0
+    ) -> AsyncIterator[Dict[str, float]]:
+        """
+        Assinar preços em tempo real via WebSocket
+
+        Substitui o anti-padrão de chamar get_current_prices em loop: o
+        servidor empurra um mapa {símbolo: preço} a cada intervalo por
+        uma única conexão, sem overhead de HTTP por atualização.
+
+        Requer o backend aiohttp (padrão) e um servidor com /ws/prices.
+
+        Args:
+            symbols: Lista de símbolos a assinar
+            interval: Intervalo entre atualizações (segundos)
+
+        Yields:
+            Dicionário {símbolo: preço_atual} a cada atualização
+        """
+        if not self._initialized:
+            await self._initialize()
+        async for prices in self._uc_stream_prices.execute(symbols, interval=interval):
+            yield prices
+
     async def get_daily_changes(self, symbols: List[str]) -> Dict[str, float]:
         """
         Obter variações diárias de símbolos
@@ -349,45 +689,64 @@ class SimpleMT5Client:
     
     Wrapper síncrono para MT5TradingClient
     Facilita uso em scripts simples
+
+    Um único event loop vive pelo tempo do wrapper: criar (e destruir) um
+    loop por chamada jogaria fora a sessão HTTP e o pool de conexões
+    aquecido a cada consulta. Com o loop persistente, chamadas síncronas
+    consecutivas reutilizam as mesmas conexões keep-alive.
     """
-    
+
     def __init__(self, **kwargs):
         self.client = MT5TradingClient(**kwargs)
-    
+        # Loop dedicado do wrapper, criado uma vez e fechado no __exit__;
+        # com uvloop instalado (extra "perf"), as idas à rede dos fan-outs
+        # ganham 2-4x sem nenhuma mudança no código chamador
+        if uvloop is not None:
+            self._loop = uvloop.new_event_loop()
+        else:
+            self._loop = asyncio.new_event_loop()
+
     def __enter__(self):
+        # Inicializar já na entrada do contexto: a primeira consulta não
+        # paga a criação da sessão
+        self._loop.run_until_complete(self.client.__aenter__())
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Fechar em loop novo se necessário
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        loop.run_until_complete(self.client.close())
-    
+            self._loop.run_until_complete(self.client.__aexit__(exc_type, exc_val, exc_tb))
+        finally:
+            self._loop.close()
+
     def _run_async(self, coro):
-        """Executar corrotina de forma síncrona"""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(coro)
+        """Executar corrotina no loop persistente do wrapper"""
+        return self._loop.run_until_complete(coro)
     
     def get_symbols(self):
         return self._run_async(self.client.get_symbols())
-    
+
+    def get_symbol_index(self):
+        return self._run_async(self.client.get_symbol_index())
+
     def get_symbol_info(self, symbol: str):
         return self._run_async(self.client.get_symbol_info(symbol))
     
     def get_current_prices(self, symbols: List[str]):
         return self._run_async(self.client.get_current_prices(symbols))
-    
+
     def get_daily_changes(self, symbols: List[str]):
         return self._run_async(self.client.get_daily_changes(symbols))
+
+    def get_prices_and_changes(self, symbols: List[str]):
+        """Obter preços atuais e variações diárias em uma única ida ao loop"""
+        async def _snapshot():
+            return await asyncio.gather(
+                self.client.get_current_prices(symbols),
+                self.client.get_daily_changes(symbols)
+            )
+
+        prices, changes = self._run_async(_snapshot())
+        return prices, changes
     
     def check_health(self):
         return self._run_async(self.client.check_health())
@@ -34,10 +34,32 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "aiohttp>=3.8.0",
+        "msgspec>=0.18.0",
         "numpy>=1.21.0",
         "python-dotenv>=0.19.0",
     ],
     extras_require={
+        "accel": [
+            "numba>=0.57",
+        ],
+        "frame": [
+            "pandas>=1.5",
+        ],
+        "arrow": [
+            "pyarrow>=14",
+        ],
+        "stream": [
+            "ijson>=3.1",
+        ],
+        "http2": [
+            "httpx[http2]>=0.24",
+        ],
+        "cache": [
+            "redis>=4.2",
+        ],
+        "perf": [
+            "uvloop>=0.19; platform_system != 'Windows'",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-asyncio>=0.18.0",